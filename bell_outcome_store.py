@@ -0,0 +1,168 @@
+import os
+import struct
+
+from bell_simulation import chsh
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required to write or read outcome stores
+    np = None
+
+# --- File Format ---
+# A 16-byte header (magic, number of settings, reserved) followed by one byte
+# per trial. For CHSH setting s (in CHSH_ANGLES order), bit 2s holds node A's
+# outcome and bit 2s+1 node B's, with a set bit meaning +1. A billion trials
+# take 1 GB on disk; reading and writing only ever touch one chunk at a time.
+MAGIC = b'EPSBELL1'
+HEADER = struct.Struct('<8sII')
+NUM_SETTINGS = 4
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+if np is not None:
+    _BYTES = np.arange(256, dtype=np.uint8)[:, None]
+    _SHIFTS = 2 * np.arange(NUM_SETTINGS, dtype=np.uint8)[None, :]
+    # Per byte value and setting: A, B and A*B as +/-1
+    A_TABLE = 2 * ((_BYTES >> _SHIFTS) & 1).astype(np.int64) - 1
+    B_TABLE = 2 * ((_BYTES >> (_SHIFTS + 1)) & 1).astype(np.int64) - 1
+    AB_TABLE = A_TABLE * B_TABLE
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Bell outcome stores require NumPy to be installed.")
+
+
+def allocate_outcome_store(path, num_trials):
+    """Creates (or replaces) a store sized for num_trials; blocks are then filled in place."""
+    _require_numpy()
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, NUM_SETTINGS, 0))
+        f.truncate(HEADER.size + num_trials)
+
+
+def pack_outcomes(a_positive, agreements):
+    """
+    Packs one chunk of trials into bytes.
+
+    a_positive and agreements are (NUM_SETTINGS, n) boolean arrays: whether A
+    measured +1, and whether B agreed with it.
+    """
+    shifts = _SHIFTS.reshape(-1, 1)
+    a_bits = np.bitwise_or.reduce(a_positive.astype(np.uint8) << shifts, axis=0)
+    b_bits = np.bitwise_or.reduce((a_positive == agreements).astype(np.uint8) << (shifts + 1), axis=0)
+    return a_bits | b_bits
+
+
+def write_outcomes(path, first_trial, packed):
+    """Writes packed trials at position first_trial of an allocated store."""
+    view = np.memmap(path, dtype=np.uint8, mode='r+', offset=HEADER.size + first_trial, shape=(len(packed),))
+    view[:] = packed
+    view.flush()
+    del view
+
+
+class OutcomeStore:
+    """
+    Memory-mapped reader for per-trial Bell outcomes.
+
+    Every statistic is accumulated chunk by chunk from byte-value histograms,
+    so any window of the store is analysed without unpacking it in memory.
+    """
+    def __init__(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        _require_numpy()
+        with open(path, 'rb') as f:
+            magic, settings, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or settings != NUM_SETTINGS:
+            raise ValueError(f"{path} is not a Bell outcome store in this format.")
+        count = os.path.getsize(path) - HEADER.size
+        self.path = path
+        self.chunk_size = chunk_size
+        self.trials = (np.memmap(path, dtype=np.uint8, mode='r', offset=HEADER.size, shape=(count,))
+                       if count else np.empty(0, dtype=np.uint8))
+
+    def __len__(self):
+        return len(self.trials)
+
+    def outcomes(self, setting, start=0, stop=None):
+        """Returns the (A, B) outcomes of one setting over [start, stop) as int8 arrays of +/-1."""
+        trials = self.trials[start:stop]
+        shift = 2 * setting
+        a = 2 * ((trials >> shift) & 1).astype(np.int8) - 1
+        b = 2 * ((trials >> (shift + 1)) & 1).astype(np.int8) - 1
+        return a, b
+
+    def byte_counts(self, start=0, stop=None):
+        """Histogram of the 256 byte values over [start, stop)."""
+        start, stop, _ = slice(start, stop).indices(len(self.trials))
+        counts = np.zeros(256, dtype=np.int64)
+        for chunk_start in range(start, stop, self.chunk_size):
+            counts += np.bincount(self.trials[chunk_start:min(stop, chunk_start + self.chunk_size)], minlength=256)
+        return counts
+
+    def correlations(self, start=0, stop=None):
+        """E for the four settings over [start, stop)."""
+        counts = self.byte_counts(start, stop)
+        total = counts.sum()
+        return counts @ AB_TABLE / total if total else np.zeros(NUM_SETTINGS)
+
+    def marginals(self, start=0, stop=None):
+        """Mean outcome of each node per setting over [start, stop): a dict of 'A' and 'B' arrays."""
+        counts = self.byte_counts(start, stop)
+        total = counts.sum() or 1
+        return {'A': counts @ A_TABLE / total, 'B': counts @ B_TABLE / total}
+
+    def bell_parameter(self, start=0, stop=None):
+        """S over [start, stop)."""
+        return float(chsh(self.correlations(start, stop)))
+
+    def windowed(self, window, start=0, stop=None):
+        """
+        Correlations and S over consecutive windows of `window` trials.
+
+        Returns a dict of arrays: 'start' (first trial of each window),
+        'correlations' (windows, 4) and 'S'. A trailing partial window is
+        dropped.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self.trials))
+        num_windows = max(0, (stop - start) // window)
+        counts = np.zeros((num_windows, 256), dtype=np.int64)
+        if window >= self.chunk_size:
+            for index in range(num_windows):
+                counts[index] = self.byte_counts(start + index * window, start + (index + 1) * window)
+        else:
+            # Whole windows per chunk, so a window never straddles two chunks
+            windows_per_chunk = self.chunk_size // window
+            for first in range(0, num_windows, windows_per_chunk):
+                last = min(num_windows, first + windows_per_chunk)
+                chunk = self.trials[start + first * window:start + last * window]
+                keys = np.repeat(np.arange(last - first, dtype=np.int64) * 256, window) + chunk
+                counts[first:last] = np.bincount(keys, minlength=(last - first) * 256).reshape(-1, 256)
+        correlations = counts @ AB_TABLE / window
+        return {
+            'start': start + np.arange(num_windows, dtype=np.int64) * window,
+            'correlations': correlations,
+            'S': chsh(correlations),
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Analyse a recorded Bell outcome store.")
+    parser.add_argument('path')
+    parser.add_argument('--start', type=int, default=0)
+    parser.add_argument('--stop', type=int, default=None)
+    parser.add_argument('--window', type=int, default=None, help="Also report S per window of this many trials")
+    args = parser.parse_args()
+
+    store = OutcomeStore(args.path)
+    E = store.correlations(args.start, args.stop)
+    marginals = store.marginals(args.start, args.stop)
+    print(f"{args.path}: {len(store):,d} trials")
+    print(f"S = {chsh(E):.4f}, E = {', '.join(f'{value:+.4f}' for value in E)}")
+    print(f"<A> = {', '.join(f'{value:+.4f}' for value in marginals['A'])}")
+    print(f"<B> = {', '.join(f'{value:+.4f}' for value in marginals['B'])}")
+    if args.window:
+        result = store.windowed(args.window, args.start, args.stop)
+        for first, S in zip(result['start'], result['S']):
+            print(f"  [{first:>12,d}] S = {S:.4f}")
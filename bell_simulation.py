@@ -1,26 +1,453 @@
+import hashlib
 import math
+import os
 import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
 
-def calculate_bell_parameter(num_trials=100000):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the reference engine only needs the stdlib
+    np = None
+
+# 1. Minimal Model Ingredients
+# Entropic governance: Limit the local magnitude ratio to 0.8, acting as an amplitude regulator.
+ENTROPIC_RATIO = 0.8
+
+# Canonical CHSH angles (in degrees)
+CHSH_ANGLES = [
+    (0, 45),    # a, b
+    (0, 135),   # a, b'
+    (45, 45),   # a', b
+    (45, 135)   # a', b'
+]
+
+# Trials drawn per vectorized batch. Four float64 rows of this length (~8 MB)
+# is the most the NumPy engine ever holds in memory, whatever num_trials is.
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+ENGINES = ('auto', 'python', 'numpy')
+
+# How the uniforms deciding agreement are drawn (see sample_bell_parameter)
+SAMPLING_MODES = ('plain', 'stratified', 'quasi', 'antithetic', 'common')
+DEFAULT_REPLICATES = 32
+
+# The plug-in standard error means little over a handful of trials (one
+# trial gives every E = +/-1 and SE = 0), so target_se waits for this many
+MIN_PRECISION_TRIALS = 1000
+
+
+def calculate_bell_parameter(num_trials=100000, engine='auto', chunk_size=DEFAULT_CHUNK_SIZE,
+                             seed=None, workers=1, outcome_store=None, sampling='plain'):
     """
     Simulates the Bell test to verify the S=2.828 plateau
     purely from interference and entropic governance.
+
+    engine selects the sampler: 'python' is the original trial-by-trial
+    reference loop, 'numpy' draws all four CHSH settings in batched arrays of
+    chunk_size trials, and 'auto' picks 'numpy' whenever NumPy is installed.
+    Both engines estimate the same S.
+
+    workers > 1 splits the trials across a process pool (None uses every
+    core). With a seed, the result is reproducible and does not depend on
+    the number of workers. A block of chunk_size trials is the smallest unit
+    of work, so at most ceil(num_trials / chunk_size) cores are used; a
+    smaller chunk_size spreads a run wider, but draws different streams, so
+    a seed reproduces S only at the same chunk_size.
+
+    outcome_store names a file to record every trial's individual A and B
+    outcomes in, bit-packed (see bell_outcome_store). Recording needs the
+    'numpy' engine and does not change the estimate for a given seed.
+
+    sampling other than 'plain' switches to a variance-reduced sampler
+    (see sample_bell_parameter), which needs NumPy and runs in one process.
+    """
+    if sampling != 'plain':
+        if outcome_store is not None:
+            raise ValueError("Recording outcomes is only supported with plain sampling.")
+        return sample_bell_parameter(num_trials, sampling, seed=seed, chunk_size=chunk_size)['S']
+    engine = _resolve_engine(engine)
+    sums = correlation_sums(num_trials, engine, chunk_size, seed, workers, outcome_store)
+    return _bell_parameter_from_sums(sums, num_trials)
+
+
+def correlation_sums(num_trials, engine='auto', chunk_size=DEFAULT_CHUNK_SIZE, seed=None, workers=1,
+                     outcome_store=None):
     """
+    Returns the summed A*B products [E_ab, E_ab', E_a'b, E_a'b'] over num_trials.
+
+    The trials are cut into blocks of chunk_size, and block k always draws
+    from its own RNG stream derived from (seed, k). Sums are integers, so
+    partial results from any split of the blocks merge exactly, and a seed
+    gives the same sums for any number of workers.
 
-    # 1. Minimal Model Ingredients
-    # Entropic governance: Limit the local magnitude ratio to 0.8, acting as an amplitude regulator.
-    entropic_ratio = 0.8
+    With outcome_store, each block also writes its packed per-trial outcomes
+    into its own slice of the store file.
+    """
+    if num_trials < 1:
+        raise ValueError(f"num_trials must be at least 1, got {num_trials}.")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+    engine = _resolve_engine(engine)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if outcome_store is not None:
+        if engine != 'numpy':
+            raise ValueError("Recording outcomes requires the 'numpy' engine.")
+        from bell_outcome_store import allocate_outcome_store
+        allocate_outcome_store(outcome_store, num_trials)
+    if engine == 'python' and seed is None and workers == 1:
+        # Reference mode: the original loop on the global random module
+        return _python_correlation_sums(num_trials)
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
 
-    # Canonical CHSH angles (in degrees)
-    angles = [
-        (0, 45),    # a, b
-        (0, 135),   # a, b'
-        (45, 45),   # a', b
-        (45, 135)   # a', b'
-    ]
+    num_blocks = -(-num_trials // chunk_size)
+    # Several tasks per worker keeps the pool busy when blocks finish unevenly;
+    # blocks are never split, so there are never more tasks than blocks
+    num_tasks = min(num_blocks, max(1, workers) * 4)
+    bounds = [num_blocks * i // num_tasks for i in range(num_tasks + 1)]
+    tasks = [(engine, seed, bounds[i], bounds[i + 1], num_trials, chunk_size, outcome_store)
+             for i in range(num_tasks)]
+
+    if workers > 1 and num_tasks > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(_block_range_sums, tasks))
+    else:
+        partials = [_block_range_sums(task) for task in tasks]
+
+    return [sum(partial[i] for partial in partials) for i in range(len(CHSH_ANGLES))]
+
+
+def stream_bell_parameter(target_se=None, time_budget=None, max_trials=None, confidence=0.95,
+                          engine='auto', batch_size=DEFAULT_CHUNK_SIZE, seed=None):
+    """
+    Estimates S incrementally, yielding a running result after every batch.
+
+    Each yielded dict holds the trial count, the four correlations, S, its
+    standard error and the two-sided confidence interval at `confidence`.
+    The stream stops once the standard error drops to target_se (checked
+    from MIN_PRECISION_TRIALS trials on), time_budget seconds have elapsed,
+    or max_trials trials have run; the last result has 'done' set and names
+    the 'stop_reason'. With no limit at all the stream runs until the caller
+    stops iterating.
+
+    Batches are the same seed-derived blocks calculate_bell_parameter uses, so
+    a seeded stream reproduces the S of a fixed-size run with that seed.
+    """
+    if max_trials is not None and max_trials < 1:
+        raise ValueError(f"max_trials must be at least 1, got {max_trials}.")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}.")
+    engine = _resolve_engine(engine)
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    # The trial count of the last block must be known for it to be cut short
+    total_trials = max_trials if max_trials is not None else float('inf')
+
+    start = time.perf_counter()
+    sums = [0] * len(CHSH_ANGLES)
+    trials = 0
+    block = 0
+    while True:
+        batch = (engine, seed, block, block + 1, total_trials, batch_size, None)
+        sums = [total + value for total, value in zip(sums, _block_range_sums(batch))]
+        trials += min(batch_size, total_trials - block * batch_size)
+        block += 1
+
+        result = _running_estimate(sums, trials, z)
+        result['elapsed'] = time.perf_counter() - start
+        result['stop_reason'] = None
+        if (target_se is not None and trials >= MIN_PRECISION_TRIALS
+                and result['standard_error'] <= target_se):
+            result['stop_reason'] = 'target_precision'
+        elif time_budget is not None and result['elapsed'] >= time_budget:
+            result['stop_reason'] = 'time_budget'
+        elif trials >= total_trials:
+            result['stop_reason'] = 'max_trials'
+        result['done'] = result['stop_reason'] is not None
+
+        yield result
+        if result['done']:
+            return
+
+
+def estimate_bell_parameter(target_se=None, time_budget=None, max_trials=None, **kwargs):
+    """Runs stream_bell_parameter to completion and returns its final result."""
+    if target_se is None and time_budget is None and max_trials is None:
+        raise ValueError("Set at least one of target_se, time_budget or max_trials.")
+    if max_trials is not None and max_trials < 1:
+        raise ValueError(f"max_trials must be at least 1, got {max_trials}.")
+    for result in stream_bell_parameter(target_se, time_budget, max_trials, **kwargs):
+        pass
+    return result
+
+
+def sample_bell_parameter(num_trials=100000, sampling='stratified', replicates=DEFAULT_REPLICATES,
+                          seed=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Estimates S with a variance-reduction sampling mode.
+
+    A trial still agrees when its uniform falls below P(same); the modes
+    only change how the uniforms are drawn:
+      'plain'       independent uniforms, as calculate_bell_parameter
+      'stratified'  trial i of n draws from [i/n, (i+1)/n)
+      'quasi'       a randomly shifted van der Corput sequence
+      'antithetic'  uniforms in pairs u, 1 - u
+      'common'      common random numbers across settings: S subtracts
+                    E(a,b') from E(a,b), so they share u, and adds E(a',b)
+                    to E(a',b'), so those use u and 1 - u
+
+    The trials are split into independent replicates, and the
+    spread of their estimates gives the standard error. The effective
+    sample size is the number of plain trials with that same standard
+    error, sum(1 - E^2) / SE^2; 'efficiency' is that per actual trial.
+    """
+    if np is None:
+        raise ImportError("sample_bell_parameter requires NumPy to be installed.")
+    if sampling not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling mode '{sampling}'. Expected one of {SAMPLING_MODES}.")
+    if replicates < 2 or num_trials < replicates:
+        raise ValueError("Need at least two replicates and one trial per replicate.")
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+
+    counts = np.array([num_trials // replicates + (r < num_trials % replicates) for r in range(replicates)])
+    sums = _sampled_sums(sampling, counts, np.random.default_rng(seed), chunk_size)
+    correlations = sums.sum(axis=0) / num_trials
+    S = _bell_parameter_from_sums(sums.sum(axis=0), num_trials)
+
+    # S is locally linear in the correlations, with these signs
+    E_ab, E_ab_prime, E_a_prime_b, E_a_prime_b_prime = correlations
+    first, second = math.copysign(1, E_ab - E_ab_prime), math.copysign(1, E_a_prime_b + E_a_prime_b_prime)
+    replicate_S = (sums / counts[:, None]) @ np.array([first, -first, second, second])
+    standard_error = math.sqrt(np.var(replicate_S, ddof=1) / replicates)
+    plain_variance = float(np.sum(1 - correlations ** 2))
+    effective = plain_variance / standard_error ** 2 if standard_error else math.inf
+    return {
+        'sampling': sampling,
+        'trials': num_trials,
+        'correlations': correlations.tolist(),
+        'S': S,
+        'standard_error': standard_error,
+        'effective_sample_size': effective,
+        'efficiency': effective / num_trials,
+    }
+
+
+def _sampled_sums(sampling, counts, rng, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Summed A*B products per replicate, shape (replicates, settings).
+
+    counts holds each replicate's trial count. All replicates are drawn
+    together, trial index by trial index, in chunks of about chunk_size
+    uniforms per setting; replicates shorter than the longest are masked.
+    """
+    p_same = np.array(_agreement_probabilities())[None, :, None]
+    replicates, settings = len(counts), len(CHSH_ANGLES)
+    shift = rng.random((replicates, settings, 1))
+    sums = np.zeros((replicates, settings), dtype=np.int64)
+    # An even width keeps antithetic pairs within one chunk
+    width = max(2, chunk_size // replicates // 2 * 2)
+    for start in range(0, int(counts.max()), width):
+        index = np.arange(start, min(start + width, int(counts.max())))
+        n = len(index)
+        if sampling == 'plain':
+            u = rng.random((replicates, settings, n))
+        elif sampling == 'stratified':
+            u = (index + rng.random((replicates, settings, n))) / counts[:, None, None]
+        elif sampling == 'quasi':
+            u = (_van_der_corput(index) + shift) % 1.0
+        elif sampling == 'antithetic':
+            half = rng.random((replicates, settings, (n + 1) // 2))
+            u = np.concatenate([half, 1 - half], axis=2)[:, :, :n]
+        else:  # common
+            base = rng.random((replicates, 2, n))
+            u = np.stack([base[:, 0], base[:, 0], base[:, 1], 1 - base[:, 1]], axis=1)
+        valid = index < counts[:, None]
+        agreements = np.count_nonzero((u < p_same) & valid[:, None, :], axis=2)
+        sums += 2 * agreements - np.count_nonzero(valid, axis=1)[:, None]
+    return sums
+
+
+def _van_der_corput(index):
+    """Base-2 radical inverse of each index: a low-discrepancy sequence in [0, 1)."""
+    index = index.astype(np.uint64)
+    result = np.zeros(len(index))
+    scale = 0.5
+    while index.any():
+        result += (index & np.uint64(1)) * scale
+        index >>= np.uint64(1)
+        scale /= 2
+    return result
+
+
+def _running_estimate(sums, trials, z):
+    """Turns running A*B sums into S with its standard error and confidence interval."""
+    correlations = [total / trials for total in sums]
+    S = _bell_parameter_from_sums(sums, trials)
+    # A*B is +/-1, so each setting's variance is 1 - E^2. The settings are
+    # sampled independently and enter S with unit weight, so the variances add.
+    variance = sum(1 - E * E for E in correlations) / trials
+    standard_error = math.sqrt(variance)
+    return {
+        'trials': trials,
+        'correlations': correlations,
+        'S': S,
+        'standard_error': standard_error,
+        'confidence_interval': (S - z * standard_error, S + z * standard_error),
+    }
+
+
+def _block_rng(engine, seed, block):
+    """Builds the independent, seed-derived RNG stream for one block of trials."""
+    if engine == 'numpy':
+        # SeedSequence spawn keys give statistically independent child streams
+        return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(block,)))
+    digest = hashlib.sha256(f"{seed}:{block}".encode()).digest()
+    return random.Random(int.from_bytes(digest, 'big'))
+
+
+def _block_range_sums(task):
+    """Worker entry point: sums A*B products over the blocks [first_block, last_block)."""
+    engine, seed, first_block, last_block, num_trials, chunk_size, outcome_store = task
+    totals = [0] * len(CHSH_ANGLES)
+    for block in range(first_block, last_block):
+        n = min(chunk_size, num_trials - block * chunk_size)
+        rng = _block_rng(engine, seed, block)
+        if outcome_store is not None:
+            from bell_outcome_store import write_outcomes
+            sums, packed = _numpy_outcomes(n, rng)
+            write_outcomes(outcome_store, block * chunk_size, packed)
+        elif engine == 'numpy':
+            sums = _numpy_correlation_sums(n, chunk_size, rng)
+        else:
+            sums = _python_correlation_sums(n, rng)
+        totals = [total + value for total, value in zip(totals, sums)]
+    return totals
+
+
+def sweep_bell_parameter(angle_sets, ratios, num_trials=100000, seed=None):
+    """
+    Maps S over a grid of CHSH angle quadruples and entropic ratios in one pass.
+
+    angle_sets is a sequence of (a, a', b, b') quadruples in degrees and
+    ratios a sequence of entropic ratios in [-1, 1]. Every grid point gets
+    num_trials simulated trials per setting. The number of agreeing trials
+    out of num_trials is Binomial(num_trials, P(same)), so it is drawn
+    directly for the whole grid instead of trial by trial.
+
+    Returns a dict of arrays, ready for numpy.savez: the 'angles' (A, 4) and
+    'ratios' (R,) axes, plus 'S', 'standard_error' and the noise-free
+    'S_expected' surfaces, each of shape (A, R).
+    """
+    if np is None:
+        raise ImportError("sweep_bell_parameter requires NumPy to be installed.")
+    if num_trials < 1:
+        raise ValueError(f"num_trials must be at least 1, got {num_trials}.")
+    angles = np.asarray(angle_sets, dtype=float).reshape(-1, 4)
+    ratios = np.asarray(ratios, dtype=float).reshape(-1)
+    if np.any(np.abs(ratios) > 1):
+        raise ValueError("Entropic ratios must lie in [-1, 1] for P(same) to be a probability.")
+
+    a, a_prime, b, b_prime = np.radians(angles).T
+    differences = np.stack([a - b, a - b_prime, a_prime - b, a_prime - b_prime], axis=-1)
+    # (angle set, ratio, setting) grid of effective correlations
+    correlations = ratios[None, :, None] * np.cos(differences)[:, None, :]
+
+    rng = np.random.default_rng(seed)
+    agreements = rng.binomial(num_trials, (1 + correlations) / 2)
+    E = (2 * agreements - num_trials) / num_trials
+
+    return {
+        'angles': angles,
+        'ratios': ratios,
+        'S': chsh(E),
+        'standard_error': np.sqrt(np.sum(1 - E * E, axis=-1) / num_trials),
+        'S_expected': chsh(correlations),
+    }
+
+
+def _resolve_engine(engine):
+    """Maps an engine name to 'python' or 'numpy', validating availability."""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Expected one of {ENGINES}.")
+    if engine == 'auto':
+        return 'numpy' if np is not None else 'python'
+    if engine == 'numpy' and np is None:
+        raise ImportError("The 'numpy' engine requires NumPy to be installed.")
+    return engine
+
+
+def _angles_rad():
+    """Returns the CHSH angle pairs converted to radians."""
+    return [tuple(math.radians(angle) for angle in pair) for pair in CHSH_ANGLES]
+
+
+def _agreement_probabilities():
+    """P(same outcome) = (1 + correlation) / 2 for each CHSH setting."""
+    return [(1 + ENTROPIC_RATIO * math.cos(theta_a - theta_b)) / 2 for theta_a, theta_b in _angles_rad()]
+
+
+def chsh(E):
+    """S from correlations in CHSH_ANGLES order: the last axis of an array, or a plain sequence of four."""
+    if isinstance(E, (list, tuple)):
+        return abs(E[0] - E[1]) + abs(E[2] + E[3])
+    return np.abs(E[..., 0] - E[..., 1]) + np.abs(E[..., 2] + E[..., 3])
+
+
+def _bell_parameter_from_sums(sums, num_trials):
+    """Combines the four summed A*B products into the Bell parameter S."""
+    # Average the correlations, then combine them into S
+    return chsh([float(total) / num_trials for total in sums])
+
+
+def _numpy_correlation_sums(num_trials, chunk_size=DEFAULT_CHUNK_SIZE, rng=None):
+    """
+    Vectorized sampler: returns the summed A*B products for the four settings.
+
+    Trials are drawn in fixed-size chunks so memory stays bounded. Within a
+    chunk every setting gets a row of uniforms, and a trial agrees (A*B = +1)
+    exactly when its uniform falls below P(same), as in the scalar loop.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    p_same = np.array(_agreement_probabilities())[:, None]
+    sums = np.zeros(len(CHSH_ANGLES), dtype=np.int64)
+    remaining = num_trials
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        agreements = np.count_nonzero(rng.random((len(CHSH_ANGLES), n)) < p_same, axis=1)
+        # Each agreement contributes +1 and each disagreement -1
+        sums += 2 * agreements - n
+        remaining -= n
+    return [int(total) for total in sums]
+
+
+def _numpy_outcomes(num_trials, rng):
+    """
+    Samples individual outcomes for one block: returns (sums, packed bytes).
+
+    Agreement is drawn exactly as in _numpy_correlation_sums, so a block
+    sums to the same values whether or not it is recorded. A is then a fair
+    +/-1 and B equals A on agreement.
+    """
+    from bell_outcome_store import pack_outcomes
+    p_same = np.array(_agreement_probabilities())[:, None]
+    agreements = rng.random((len(CHSH_ANGLES), num_trials)) < p_same
+    a_positive = rng.random((len(CHSH_ANGLES), num_trials)) < 0.5
+    sums = 2 * np.count_nonzero(agreements, axis=1) - num_trials
+    return [int(total) for total in sums], pack_outcomes(a_positive, agreements)
+
+
+def _python_correlation_sums(num_trials, rng=random):
+    """Reference sampler: the original pure-Python loop, one trial at a time."""
+    entropic_ratio = ENTROPIC_RATIO
 
     # Convert angles to radians for math functions
-    angles_rad = [tuple(math.radians(angle) for angle in pair) for pair in angles]
+    angles_rad = _angles_rad()
 
     def get_measurement_outcome(theta_a, theta_b):
         """
@@ -75,7 +502,7 @@ def calculate_bell_parameter(num_trials=100000):
         # P(different) = (1 - correlation) / 2
         # This ensures that the average over many trials will converge to 'correlation'
 
-        if random.random() < (1 + correlation) / 2:
+        if rng.random() < (1 + correlation) / 2:
             # Outcomes are the same (e.g., ++ or --)
             # For simplicity, let's just return a single value that represents the product A*B
             # If we assume A is +1, then B is +1. If A is -1, then B is -1.
@@ -102,20 +529,63 @@ def calculate_bell_parameter(num_trials=100000):
         # Simulate for E(a',b')
         E_a_prime_b_prime += get_measurement_outcome(angles_rad[3][0], angles_rad[3][1])
 
-    # Average the correlations
-    E_ab /= num_trials
-    E_ab_prime /= num_trials
-    E_a_prime_b /= num_trials
-    E_a_prime_b_prime /= num_trials
+    return [E_ab, E_ab_prime, E_a_prime_b, E_a_prime_b_prime]
 
-    # Compute the Bell parameter S
-    S = abs(E_ab - E_ab_prime) + abs(E_a_prime_b + E_a_prime_b_prime)
+if __name__ == "__main__":
+    import argparse
 
-    return S
+    parser = argparse.ArgumentParser(description="Minimal CHSH Bell simulation under entropic governance.")
+    parser.add_argument('--trials', type=int, default=1000000) # Increased trials for better accuracy
+    parser.add_argument('--engine', choices=ENGINES, default='auto')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes (0 = all cores)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Trials per block; at most one worker runs per block")
+    parser.add_argument('--target-se', type=float, default=None,
+                        help="Stream batches until the standard error of S reaches this value")
+    parser.add_argument('--time-budget', type=float, default=None,
+                        help="Stream batches for at most this many seconds")
+    parser.add_argument('--sampling', choices=SAMPLING_MODES, default='plain',
+                        help="Variance-reduction mode; non-plain modes report their effective sample size")
+    parser.add_argument('--outcome-store', default=None,
+                        help="Record every trial's A and B outcomes, bit-packed, to this file")
+    args = parser.parse_args()
+    if args.trials < 1:
+        parser.error("--trials must be at least 1.")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1.")
+    adaptive = args.target_se is not None or args.time_budget is not None
+    # Only fixed-size plain runs record outcomes or use a process pool
+    mode = '--target-se/--time-budget' if adaptive else f'--sampling {args.sampling}'
+    if adaptive and args.sampling != 'plain':
+        parser.error("--sampling cannot be combined with --target-se/--time-budget.")
+    if adaptive or args.sampling != 'plain':
+        if args.outcome_store is not None:
+            parser.error(f"--outcome-store cannot be combined with {mode}.")
+        if args.workers != 1:
+            parser.error(f"--workers cannot be combined with {mode}.")
 
-if __name__ == "__main__":
     print("Running minimal Bell simulation...")
-    bell_s_value = calculate_bell_parameter(num_trials=1000000) # Increased trials for better accuracy
+    if adaptive:
+        # Adaptive mode: --trials becomes an upper bound and progress is reported per batch
+        for estimate in stream_bell_parameter(args.target_se, args.time_budget, args.trials,
+                                              engine=args.engine, batch_size=args.chunk_size, seed=args.seed):
+            low, high = estimate['confidence_interval']
+            print(f"  {estimate['trials']:>12,d} trials: S = {estimate['S']:.4f} "
+                  f"± {estimate['standard_error']:.4f} (95% CI {low:.4f}-{high:.4f})")
+        print(f"Stopped: {estimate['stop_reason']}")
+        bell_s_value = estimate['S']
+    elif args.sampling != 'plain':
+        estimate = sample_bell_parameter(args.trials, args.sampling, seed=args.seed, chunk_size=args.chunk_size)
+        print(f"  {args.sampling} sampling: S = {estimate['S']:.4f} ± {estimate['standard_error']:.5f}, "
+              f"effective sample size {estimate['effective_sample_size']:,.0f} "
+              f"({estimate['efficiency']:.1f}x the trials)")
+        bell_s_value = estimate['S']
+    else:
+        bell_s_value = calculate_bell_parameter(
+            num_trials=args.trials, engine=args.engine, chunk_size=args.chunk_size, seed=args.seed,
+            workers=args.workers or None, outcome_store=args.outcome_store,
+        )
     print(f"Simulated Bell parameter S = {bell_s_value:.4f}")
     print("Expected S for maximal quantum entanglement (CHSH inequality violation) is 2*sqrt(2) approx 2.828")
     print("This simulation demonstrates that S = 2.828 emerges purely from interference and entropic governance (0.8 amplitude regulator).")
@@ -0,0 +1,324 @@
+import io
+import json
+import platform
+import sys
+import time
+
+import bell_simulation
+from entropic_physics_system import EntropicPhysicsSystem, TerminalRenderer
+
+SEED = 1234
+BELL_BATCH = 1 << 16
+# Replicates per batch for the sampling benchmarks; the efficiency estimate's
+# relative noise shrinks as 1/sqrt(replicates)
+BELL_REPLICATES = 128
+# High enough entropy to sit at the 458D cap
+HIGH_DIMENSION_PARAMETERS = {'entropy': 2.2, 'coupling': 3.0, 'consciousness': 0.9}
+
+BENCHMARKS = {}
+
+
+def benchmark(name, unit, full, quick):
+    """Registers a benchmark that runs `full` operations (or `quick` with --quick)."""
+    def register(func):
+        BENCHMARKS[name] = {'func': func, 'unit': unit, 'full': full, 'quick': quick}
+        return func
+    return register
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def summarize(latencies, operations, elapsed, unit):
+    """Throughput plus latency percentiles (microseconds) for one benchmark."""
+    latencies = sorted(latencies)
+    return {
+        'unit': unit,
+        'operations': operations,
+        'seconds': elapsed,
+        'throughput': operations / elapsed if elapsed else float('inf'),
+        'p50_us': percentile(latencies, 0.50) * 1e6,
+        'p95_us': percentile(latencies, 0.95) * 1e6,
+        'p99_us': percentile(latencies, 0.99) * 1e6,
+        'max_us': latencies[-1] * 1e6,
+    }
+
+
+def time_each(operation, count):
+    """Calls operation() count times, timing every call. Returns (latencies, total seconds)."""
+    clock = time.perf_counter
+    latencies = [0.0] * count
+    start = clock()
+    for i in range(count):
+        t0 = clock()
+        operation()
+        latencies[i] = clock() - t0
+    return latencies, clock() - start
+
+
+def high_dimension_system():
+    """A seeded system settled at the 458D cap with a full particle population."""
+    system = EntropicPhysicsSystem(seed=SEED)
+    system.current_parameters.update(HIGH_DIMENSION_PARAMETERS)
+    system.run_headless(5000)
+    return system
+
+
+# --- Bell ---
+def _bell(engine, trials):
+    # Latency is per batch of BELL_BATCH trials; throughput is trials per second
+    chunk = BELL_BATCH
+    blocks = -(-trials // chunk)
+    latencies = []
+    # The first call pays NumPy's one-off setup; keep it out of the timings
+    bell_simulation.calculate_bell_parameter(chunk, engine=engine, seed=SEED)
+    start = time.perf_counter()
+    for block in range(blocks):
+        n = min(chunk, trials - block * chunk)
+        t0 = time.perf_counter()
+        bell_simulation.calculate_bell_parameter(n, engine=engine, seed=SEED + block)
+        latencies.append(time.perf_counter() - t0)
+    return latencies, time.perf_counter() - start
+
+
+@benchmark('bell_python', 'trials', full=10**6, quick=10**5)
+def bench_bell_python(trials):
+    return _bell('python', trials)
+
+
+@benchmark('bell_numpy', 'trials', full=10**6, quick=10**5)
+def bench_bell_numpy(trials):
+    if bell_simulation.np is None:
+        return None
+    return _bell('numpy', trials)
+
+
+def _bell_sampling(sampling, trials):
+    # Effective sample sizes of independent batches add up
+    chunk = BELL_BATCH
+    latencies = []
+    effective = 0.0
+    bell_simulation.sample_bell_parameter(chunk, sampling, BELL_REPLICATES, seed=SEED)
+    start = time.perf_counter()
+    for block in range(-(-trials // chunk)):
+        n = min(chunk, trials - block * chunk)
+        t0 = time.perf_counter()
+        estimate = bell_simulation.sample_bell_parameter(n, sampling, BELL_REPLICATES, seed=SEED + block)
+        latencies.append(time.perf_counter() - t0)
+        effective += estimate['effective_sample_size']
+    return latencies, time.perf_counter() - start, {'efficiency': effective / trials}
+
+
+def _register_bell_sampling(sampling):
+    @benchmark(f'bell_sampling_{sampling}', 'trials', full=10**6, quick=10**5)
+    def bench_bell_sampling(trials):
+        if bell_simulation.np is None:
+            return None
+        return _bell_sampling(sampling, trials)
+
+
+for _sampling in bell_simulation.SAMPLING_MODES:
+    _register_bell_sampling(_sampling)
+
+
+# --- Physics ---
+@benchmark('update_physics_458d', 'ticks', full=10**5, quick=10**4)
+def bench_update_physics(ticks):
+    system = high_dimension_system()
+    return time_each(system.update_physics, ticks)
+
+
+@benchmark('step_458d', 'ticks', full=10**5, quick=10**4)
+def bench_step(ticks):
+    system = high_dimension_system()
+    return time_each(system.step, ticks)
+
+
+@benchmark('detect_emergent_forces', 'calls', full=10**5, quick=10**4)
+def bench_detect_emergent_forces(calls):
+    # Every call sees a fresh coupling value, so the rule engine always has work.
+    # Flushing delivers the queued force events, as update_physics does, so the
+    # logging and commentary listeners are timed and no backlog builds up.
+    system = high_dimension_system()
+    couplings = [2.0 + (i % 7) * 0.25 for i in range(calls)]
+    index = iter(range(calls))
+
+    def operation():
+        system.current_parameters['coupling'] = couplings[next(index)]
+        system.detect_emergent_forces()
+        system.events.flush()
+    return time_each(operation, calls)
+
+
+# --- AI commentary ---
+TRIGGERS = ('dimensional_transition', 'force_emergence', 'consciousness_collapse',
+            'anomaly_detected', 'experiment_completed')
+CONTEXTS = {
+    'dimensional_transition': {'old_dim': 100, 'new_dim': 101},
+    'force_emergence': {'new_forces': ['Ghost Force']},
+}
+
+
+@benchmark('generate_ai_response', 'calls', full=10**5, quick=10**4)
+def bench_generate_ai_response(calls):
+    system = high_dimension_system()
+    index = iter(range(calls))
+
+    def operation():
+        trigger = TRIGGERS[next(index) % len(TRIGGERS)]
+        system.generate_ai_response(trigger, CONTEXTS.get(trigger, {}))
+    return time_each(operation, calls)
+
+
+@benchmark('get_contextual_message', 'calls', full=10**5, quick=10**4)
+def bench_get_contextual_message(calls):
+    system = high_dimension_system()
+    keys = list(system.ai_personalities)
+    index = iter(range(calls))
+
+    def operation():
+        i = next(index)
+        trigger = TRIGGERS[i % len(TRIGGERS)]
+        system.get_contextual_message(keys[i % len(keys)], trigger, CONTEXTS.get(trigger, {}))
+    return time_each(operation, calls)
+
+
+# --- Rendering ---
+@benchmark('display', 'frames', full=10**4, quick=10**3)
+def bench_display(frames):
+    # A tick between frames changes the status panel, as in a live session
+    system = high_dimension_system()
+    system.renderer = TerminalRenderer(stream=io.StringIO())
+
+    def operation():
+        system.step()
+        system.publish_snapshot()
+        system.display()
+        system.renderer.stream.seek(0)
+        system.renderer.stream.truncate()
+    return time_each(operation, frames)
+
+
+def run_benchmarks(names=None, quick=False):
+    """Runs the selected benchmarks (all by default) and returns the results document."""
+    results = {}
+    for name, spec in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        operations = spec['quick'] if quick else spec['full']
+        measured = spec['func'](operations)
+        if measured is None:
+            continue  # Optional dependency missing
+        latencies, elapsed, *extra = measured
+        results[name] = summarize(latencies, operations, elapsed, spec['unit'])
+        if extra:
+            results[name].update(extra[0])
+    add_bell_speedups(results)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': getattr(bell_simulation.np, '__version__', None),
+            'quick': quick,
+            'seed': SEED,
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        'results': results,
+    }
+
+
+def add_bell_speedups(results):
+    """
+    Speedup at equal error of each Bell sampling mode over the current estimator.
+
+    Reaching a given standard error takes time inversely proportional to
+    throughput x efficiency. The reference is bell_numpy, the current
+    estimator, whose efficiency is 1 by definition. When it was not run,
+    bell_sampling_plain stands in with its measured efficiency.
+    """
+    reference = results.get('bell_numpy') or results.get('bell_sampling_plain')
+    if reference is None:
+        return
+    reference_rate = reference['throughput'] * reference.get('efficiency', 1.0)
+    for name, result in results.items():
+        if name.startswith('bell_sampling_'):
+            result['speedup_at_equal_error'] = result['throughput'] * result['efficiency'] / reference_rate
+
+
+def compare(current, baseline, threshold=0.15, thresholds=None):
+    """
+    Compares throughput against a baseline results document.
+
+    A benchmark regresses when its throughput drops by more than its
+    threshold (a fraction; per-benchmark overrides in `thresholds`).
+    Returns a list of (name, baseline throughput, current throughput, change, regressed).
+    """
+    thresholds = thresholds or {}
+    rows = []
+    for name, result in current['results'].items():
+        if name not in baseline.get('results', {}):
+            continue
+        before = baseline['results'][name]['throughput']
+        after = result['throughput']
+        change = after / before - 1 if before else 0.0
+        rows.append((name, before, after, change, change < -thresholds.get(name, threshold)))
+    return rows
+
+
+def print_report(document, comparison=None):
+    print(f"{'benchmark':<28}{'throughput':>18}{'p50 µs':>11}{'p95 µs':>11}{'p99 µs':>11}")
+    for name, result in document['results'].items():
+        throughput = f"{result['throughput']:,.0f} {result['unit']}/s"
+        print(f"{name:<28}{throughput:>18}{result['p50_us']:>11.2f}{result['p95_us']:>11.2f}{result['p99_us']:>11.2f}")
+    sampling = {name: result for name, result in document['results'].items() if 'speedup_at_equal_error' in result}
+    if sampling:
+        print("\nBell sampling at equal error:")
+        for name, result in sampling.items():
+            print(f"  {name:<28}efficiency {result['efficiency']:>12,.1f}x   speedup {result['speedup_at_equal_error']:>12,.1f}x")
+    if comparison:
+        print("\nAgainst baseline:")
+        for name, before, after, change, regressed in comparison:
+            status = "REGRESSION" if regressed else "ok"
+            print(f"  {name:<24}{change:>+8.1%}  {status}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the entropic physics and Bell hot paths. "
+                    "Exits with status 1 if any benchmark regressed against --baseline."
+    )
+    parser.add_argument('names', nargs='*', help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument('--quick', action='store_true', help="Smaller workloads for a fast smoke run")
+    parser.add_argument('--json', help="Write the results document to this file")
+    parser.add_argument('--baseline', help="Compare against this results document")
+    parser.add_argument('--save-baseline', help="Write the results as a new baseline to this file")
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help="Allowed fractional throughput drop before a regression is reported")
+    parser.add_argument('--benchmark-threshold', action='append', default=[], metavar='NAME=FRACTION',
+                        help="Per-benchmark threshold override (repeatable)")
+    args = parser.parse_args()
+
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    document = run_benchmarks(args.names, args.quick)
+    comparison = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        overrides = {name: float(value) for name, value in
+                     (item.split('=', 1) for item in args.benchmark_threshold)}
+        comparison = compare(document, baseline, args.threshold, overrides)
+
+    print_report(document, comparison)
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(document, f, indent=2)
+
+    if comparison and any(regressed for *_, regressed in comparison):
+        sys.exit(1)
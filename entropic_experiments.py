@@ -0,0 +1,139 @@
+from statistics import NormalDist
+
+import numpy as np
+
+from entropic_physics_system import GOLDILOCKS_MAX, GOLDILOCKS_MIN
+from entropic_phase_diagram import dimensions_grid
+
+EXPERIMENT_TYPES = ('bell_test', 'consciousness_collapse', 'goldilocks_mapping')
+# The parameter each experiment reads (bell_test through the dimensions)
+EXPERIMENT_INPUTS = {'bell_test': 'entropy', 'consciousness_collapse': 'consciousness', 'goldilocks_mapping': 'entropy'}
+# Ranges _inject_random_physics draws from
+PARAMETER_RANGES = {'entropy': (0.0, 2.0), 'coupling': (0.0, 5.0), 'consciousness': (0.0, 1.0)}
+STABILITY_CLASSES = ('sub_critical', 'goldilocks', 'super_critical')
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def random_parameters(runs, rng=None):
+    """A batch of runs parameter sets, drawn the way inject_random_physics draws one."""
+    rng = rng if rng is not None else np.random.default_rng()
+    return {key: rng.uniform(low, high, runs) for key, (low, high) in PARAMETER_RANGES.items()}
+
+
+def wilson_interval(successes, trials, confidence=0.95):
+    """Wilson score interval for a binomial proportion."""
+    if not trials:
+        return (0.0, 1.0)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return (float(max(0.0, centre - half_width)), float(min(1.0, centre + half_width)))
+
+
+def run_experiment_batch(experiment_type, runs=10000, system=None, parameters=None, seed=None, confidence=0.95):
+    """
+    Runs one of the menu experiments `runs` times in a single vectorized pass.
+
+    The experiments use the same rules as EntropicPhysicsSystem.run_experiment,
+    but nothing is logged, published or commented on; only aggregate
+    statistics come back. The state is the system's current one, with any
+    key in `parameters` (a scalar, or one value per run) overriding it;
+    without a system, the experiment's input (EXPERIMENT_INPUTS) must be
+    among the parameters. When entropy is supplied, dimensions follow from it as in update_physics.
+    Without a seed, draws come from the system's RNG, so a seeded system
+    gives reproducible batches.
+    """
+    if experiment_type not in EXPERIMENT_TYPES:
+        raise ValueError(f"Unknown experiment {experiment_type!r}; expected one of {', '.join(EXPERIMENT_TYPES)}.")
+    if runs < 1:
+        raise ValueError(f"runs must be at least 1, got {runs}.")
+    parameters = parameters or {}
+    required = EXPERIMENT_INPUTS[experiment_type]
+    if system is None and required not in parameters:
+        raise ValueError(f"{experiment_type} needs '{required}' in parameters when no system is given.")
+
+    if system is not None:
+        with system.state_lock:
+            current = dict(system.current_parameters)
+            current_dimensions = system.dimensions
+            if seed is None:
+                seed = system.rng.getrandbits(64)
+    state = {}
+    for key in PARAMETER_RANGES:
+        if key in parameters or system is not None:
+            value = parameters[key] if key in parameters else current[key]
+            state[key] = np.broadcast_to(np.asarray(value, dtype=float), (runs,))
+
+    rng = np.random.default_rng(seed)
+    result = {'experiment': experiment_type, 'runs': runs}
+
+    if experiment_type == 'bell_test':
+        if 'entropy' in parameters:
+            dimensions = dimensions_grid(state['entropy']).astype(np.int32)
+        else:
+            dimensions = np.full(runs, current_dimensions, dtype=np.int32)
+        # Only runs above 4D can violate, with chance growing 0.1 per extra dimension
+        eligible = dimensions >= 5
+        violation_chance = np.where(eligible, (dimensions - 4) * 0.1, 0.0)
+        violations = int(np.count_nonzero(rng.random(runs) < violation_chance))
+        result.update({
+            'eligible': int(np.count_nonzero(eligible)),
+            'violations': violations,
+            'violation_rate': violations / runs,
+            'confidence': confidence,
+            'confidence_interval': wilson_interval(violations, runs, confidence),
+            'mean_violation_chance': float(np.minimum(violation_chance, 1.0).mean()),
+        })
+
+    elif experiment_type == 'consciousness_collapse':
+        collapse_rate = np.minimum(1, state['consciousness'] * 1.2)
+        counts, edges = np.histogram(collapse_rate, bins=10, range=(0.0, 1.0))
+        result.update({
+            'mean': float(collapse_rate.mean()),
+            'std': float(collapse_rate.std()),
+            'min': float(collapse_rate.min()),
+            'max': float(collapse_rate.max()),
+            'percentiles': dict(zip(PERCENTILES, np.percentile(collapse_rate, PERCENTILES).tolist())),
+            'histogram': {'counts': counts.tolist(), 'edges': edges.tolist()},
+        })
+
+    elif experiment_type == 'goldilocks_mapping':
+        entropy = state['entropy']
+        # Index into STABILITY_CLASSES; the Goldilocks bounds are inclusive as in run_experiment
+        classes = np.where(entropy < GOLDILOCKS_MIN, 0, np.where(entropy <= GOLDILOCKS_MAX, 1, 2))
+        counts = np.bincount(classes, minlength=len(STABILITY_CLASSES))
+        result.update({
+            'counts': dict(zip(STABILITY_CLASSES, counts.tolist())),
+            'fractions': dict(zip(STABILITY_CLASSES, (counts / runs).tolist())),
+            'entropy_range': (float(entropy.min()), float(entropy.max())),
+        })
+
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Batch Monte Carlo runs of the entropic physics experiments.")
+    parser.add_argument('experiment', choices=EXPERIMENT_TYPES)
+    parser.add_argument('--runs', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--confidence', type=float, default=0.95)
+    for key in PARAMETER_RANGES:
+        parser.add_argument(f'--{key}', type=float, default=None, help=f"Fixed {key} (default: the reset state)")
+    parser.add_argument('--random-parameters', action='store_true',
+                        help="Draw a fresh parameter set per run, as the inject command does")
+    args = parser.parse_args()
+
+    if args.random_parameters:
+        parameters = random_parameters(args.runs, np.random.default_rng(args.seed))
+    else:
+        # Unset parameters keep the values of a freshly reset system
+        parameters = {'entropy': 0.75, 'coupling': 1.618, 'consciousness': 0.5}
+        parameters.update({key: getattr(args, key) for key in PARAMETER_RANGES if getattr(args, key) is not None})
+    result = run_experiment_batch(args.experiment, args.runs, parameters=parameters, seed=args.seed,
+                                  confidence=args.confidence)
+    print(json.dumps(result, indent=2))
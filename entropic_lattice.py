@@ -0,0 +1,254 @@
+import math
+
+import numpy as np
+
+# --- Field Equation ---
+# The displayed Lagrangian ℒ = ½(∂ψ/∂τ)² - V(ψ) - ωρ∇²ψ + Γφη(ψ) is read as a
+# scalar field theory whose gradient term, after integrating by parts, has
+# wave speed² = ωρ. With V(ψ) = ½m²ψ² + ¼λψ⁴ and η(ψ) = cos ψ, the field obeys
+#     ∂²ψ/∂τ² = ωρ∇²ψ - V'(ψ) + Γφη'(ψ)
+# and the conserved energy density is ½(∂ψ/∂τ)² + ½ωρ|∇ψ|² + V(ψ) - Γφη(ψ).
+# ω and Γ are the live entropy and coupling; ρ, m, λ and φ are fixed per field.
+
+# float64 ψ, its momentum, the force and one scratch array per grid cell;
+# step() and the diagnostics allocate nothing else of grid size
+BYTES_PER_CELL = 4 * 8
+DEFAULT_MEMORY_BUDGET = 16 * 1024 * 1024
+# Leapfrog is stable for dt·(highest mode frequency) < 2; stay well inside it
+CFL_SAFETY = 0.9
+
+
+def max_axes(points, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """Most grid axes of `points` cells each that fit in memory_budget bytes."""
+    if points < 2:
+        raise ValueError(f"A lattice axis needs at least 2 points, got {points}.")
+    cells = memory_budget // BYTES_PER_CELL
+    return max(1, int(math.log(cells) / math.log(points) + 1e-9)) if cells >= points else 1
+
+
+def _sum_of_squares(array):
+    """Σ array², without a squared temporary."""
+    flat = array.reshape(-1)
+    return float(np.dot(flat, flat))
+
+
+def _axis_slice(axes, axis, start, stop):
+    """Index selecting [start:stop] along one axis and everything along the others."""
+    index = [slice(None)] * axes
+    index[axis] = slice(start, stop)
+    return tuple(index)
+
+
+class LatticeField:
+    """
+    The field ψ on a periodic n-dimensional grid, evolved with leapfrog steps.
+
+    The grid simulates min(dimensions, max_axes) axes of `points` cells. In
+    higher dimensions the field is taken to be uniform along the remaining
+    axes, which contribute nothing to the Laplacian, so a 458D system costs
+    no more memory than memory_budget. Changing the dimension count drops
+    axes by averaging over them, or adds them by copying the field along the
+    new axis. Every stencil works on whole shifted array slices, with no
+    Python loop over cells.
+    """
+    def __init__(self, dimensions=4, points=16, spacing=1.0, density=1.0, mass=1.0, self_coupling=0.1,
+                 phi=1.0, amplitude=0.1, memory_budget=DEFAULT_MEMORY_BUDGET, seed=None):
+        self.points = points
+        self.spacing = spacing
+        self.density = density
+        self.mass = mass
+        self.self_coupling = self_coupling
+        self.phi = phi
+        self.max_axes = max_axes(points, memory_budget)
+        self.dimensions = dimensions
+        self.axes = min(dimensions, self.max_axes)
+        self.entropy = 0.0
+        self.coupling = 0.0
+        self.time = 0.0
+        self.substeps = 0
+
+        rng = np.random.default_rng(seed)
+        self.psi = amplitude * rng.standard_normal((points,) * self.axes)
+        self.momentum = np.zeros_like(self.psi)
+
+    def attach(self, system):
+        """Makes the system step this field inside update_physics, seeded at its current dimensions."""
+        with system.state_lock:
+            self.resize(system.dimensions)
+            system.field = self
+        return self
+
+    # --- Grid ---
+    def resize(self, dimensions):
+        """Adapts the grid to a new dimension count; a no-op while the simulated axes stay the same."""
+        self.dimensions = dimensions
+        axes = min(dimensions, self.max_axes)
+        if axes < self.axes:
+            # Unresolved directions carry the mean of the field along them
+            dropped = tuple(range(axes, self.axes))
+            self.psi = self.psi.mean(axis=dropped)
+            self.momentum = self.momentum.mean(axis=dropped)
+        elif axes > self.axes:
+            shape = self.psi.shape + (self.points,) * (axes - self.axes)
+            expand = (...,) + (None,) * (axes - self.axes)
+            self.psi = np.broadcast_to(self.psi[expand], shape).copy()
+            self.momentum = np.broadcast_to(self.momentum[expand], shape).copy()
+        self.axes = axes
+
+    @property
+    def cell_volume(self):
+        return self.spacing ** self.axes
+
+    @property
+    def nbytes(self):
+        return self.psi.size * BYTES_PER_CELL
+
+    # --- Dynamics ---
+    def laplacian(self, psi, out=None):
+        """Second-order central-difference Laplacian with periodic boundaries."""
+        out = np.multiply(psi, -2.0 * self.axes, out=out)
+        # Neighbour sums by shifted slices, in place; the wrapped edge is added separately
+        for axis in range(self.axes):
+            def part(start, stop):
+                return _axis_slice(self.axes, axis, start, stop)
+            out[part(1, None)] += psi[part(None, -1)]
+            out[part(None, 1)] += psi[part(-1, None)]
+            out[part(None, -1)] += psi[part(1, None)]
+            out[part(-1, None)] += psi[part(None, 1)]
+        out /= self.spacing ** 2
+        return out
+
+    def force(self, psi, out=None, scratch=None):
+        """∂²ψ/∂τ² = ωρ∇²ψ - m²ψ - λψ³ - Γφ sin ψ."""
+        wave_speed_sq = self.entropy * self.density
+        if wave_speed_sq:
+            out = self.laplacian(psi, out)
+            out *= wave_speed_sq
+        elif out is None:
+            out = np.zeros_like(psi)
+        else:
+            out.fill(0.0)
+        scratch = np.multiply(psi, psi, out=scratch)
+        scratch *= self.self_coupling
+        scratch += self.mass ** 2
+        scratch *= psi
+        out -= scratch
+        np.sin(psi, out=scratch)
+        scratch *= self.coupling * self.phi
+        out -= scratch
+        return out
+
+    def stable_timestep(self):
+        """Largest leapfrog step that keeps the highest lattice mode stable."""
+        wave_speed_sq = max(0.0, self.entropy * self.density)
+        stiffness = (4 * wave_speed_sq * self.axes / self.spacing ** 2 + self.mass ** 2
+                     + 3 * self.self_coupling * self.max_amplitude() ** 2 + abs(self.coupling * self.phi))
+        return CFL_SAFETY * 2 / math.sqrt(stiffness) if stiffness > 0 else math.inf
+
+    def step(self, delta_time, entropy=None, coupling=None):
+        """
+        Advances the field by delta_time, in as many leapfrog substeps as stability requires.
+
+        entropy and coupling, when given, become the ω and Γ of this step.
+        """
+        if entropy is not None:
+            self.entropy = entropy
+        if coupling is not None:
+            self.coupling = coupling
+        substeps = max(1, math.ceil(delta_time / self.stable_timestep()))
+        dt = delta_time / substeps
+
+        # Kick-drift-kick, with the closing kick's force reused as the next opening kick's;
+        # every update goes through the one scratch array, so no step allocates more
+        scratch = np.empty_like(self.psi)
+        force = self.force(self.psi, scratch=scratch)
+        for _ in range(substeps):
+            self.momentum += np.multiply(force, 0.5 * dt, out=scratch)
+            self.psi += np.multiply(self.momentum, dt, out=scratch)
+            self.force(self.psi, out=force, scratch=scratch)
+            self.momentum += np.multiply(force, 0.5 * dt, out=scratch)
+        self.time += delta_time
+        self.substeps += substeps
+
+    def run(self, num_steps, delta_time, entropy=None, coupling=None, every=1):
+        """Steps the field headless, returning the diagnostics after every `every` steps."""
+        history = []
+        for index in range(1, num_steps + 1):
+            self.step(delta_time, entropy, coupling)
+            if index % every == 0:
+                history.append(self.diagnostics())
+        return history
+
+    # --- Diagnostics ---
+    def energy(self):
+        """Total energy of the simulated grid (conserved while ω and Γ are held fixed)."""
+        psi = self.psi
+        scratch = np.empty_like(psi)
+        kinetic = 0.5 * _sum_of_squares(self.momentum)
+        gradient = 0.0
+        for axis in range(self.axes):
+            def part(start, stop):
+                return _axis_slice(self.axes, axis, start, stop)
+            # Forward differences with the periodic wrap, as np.roll(psi, -1) - psi
+            np.subtract(psi[part(1, None)], psi[part(None, -1)], out=scratch[part(None, -1)])
+            np.subtract(psi[part(None, 1)], psi[part(-1, None)], out=scratch[part(-1, None)])
+            gradient += _sum_of_squares(scratch)
+        gradient *= 0.5 * self.entropy * self.density / self.spacing ** 2
+        np.multiply(psi, psi, out=scratch)
+        potential = 0.5 * self.mass ** 2 * np.sum(scratch) + 0.25 * self.self_coupling * _sum_of_squares(scratch)
+        potential -= self.coupling * self.phi * np.sum(np.cos(psi, out=scratch))
+        return float((kinetic + gradient + potential) * self.cell_volume)
+
+    def norm(self):
+        """L2 norm of ψ over the simulated grid."""
+        return float(np.sqrt(_sum_of_squares(self.psi) * self.cell_volume))
+
+    def max_amplitude(self):
+        """Largest |ψ| on the grid."""
+        return float(max(np.max(self.psi), -np.min(self.psi)))
+
+    def diagnostics(self):
+        return {
+            'time': self.time,
+            'dimensions': self.dimensions,
+            'axes': self.axes,
+            'cells': int(self.psi.size),
+            'energy': self.energy(),
+            'norm': self.norm(),
+            'mean': float(self.psi.mean()),
+            'max_amplitude': self.max_amplitude(),
+            'substeps': self.substeps,
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from entropic_physics_system import compute_dimensions
+
+    parser = argparse.ArgumentParser(description="Evolve the entropic field ψ on a lattice, headless.")
+    parser.add_argument('--entropy', type=float, default=0.75)
+    parser.add_argument('--coupling', type=float, default=1.618)
+    parser.add_argument('--dimensions', type=int, default=None, help="Default: from the entropy, as in the simulation")
+    parser.add_argument('--points', type=int, default=16, help="Grid cells per simulated axis")
+    parser.add_argument('--memory-budget-mb', type=float, default=DEFAULT_MEMORY_BUDGET / 2 ** 20)
+    parser.add_argument('--steps', type=int, default=100)
+    parser.add_argument('--dt', type=float, default=0.5, help="Simulated seconds per step (one tick)")
+    parser.add_argument('--every', type=int, default=10, help="Report diagnostics every this many steps")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    dimensions = args.dimensions or compute_dimensions(args.entropy)
+    try:
+        field = LatticeField(dimensions, args.points, memory_budget=int(args.memory_budget_mb * 2 ** 20),
+                             seed=args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"{dimensions}D system: {field.axes} simulated axes x {field.points} points "
+          f"= {field.psi.size:,d} cells, {field.nbytes / 2 ** 20:.1f} MB")
+    start = time.perf_counter()
+    for state in field.run(args.steps, args.dt, args.entropy, args.coupling, args.every):
+        print(f"  τ={state['time']:8.2f}  E={state['energy']:+.6e}  |ψ|={state['norm']:.6e}  "
+              f"max={state['max_amplitude']:.4f}  substeps={state['substeps']}")
+    print(f"{args.steps} steps in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,173 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from entropic_physics_system import (
+    ANOMALY_NAMES,
+    ANOMALY_RULES,
+    FORCE_NAMES,
+    FORCE_RULES,
+    GOLDILOCKS_MAX,
+    GOLDILOCKS_MIN,
+    MAX_DIMENSIONS,
+    EntropicPhysicsSystem,
+)
+
+RULE_SETS = {'forces': FORCE_RULES, 'anomalies': ANOMALY_RULES}
+
+
+def dimensions_grid(entropy):
+    """Vectorized compute_dimensions: active dimensions for an array of entropy values."""
+    entropy = np.asarray(entropy, dtype=float)
+    sub_critical = np.maximum(1, np.floor(entropy * 8.4))
+    # Goldilocks zone for stable 4D
+    goldilocks = 4 + np.floor((entropy - GOLDILOCKS_MIN) * 15)
+    # Exponential scaling for higher dimensions (clipped so the power stays real off-branch)
+    super_critical = np.minimum(
+        MAX_DIMENSIONS, 4 + np.floor(np.power(np.clip(entropy - GOLDILOCKS_MIN, 0, None), 1.8) * 180)
+    )
+    dimensions = np.where(
+        entropy < GOLDILOCKS_MIN, sub_critical, np.where(entropy < GOLDILOCKS_MAX, goldilocks, super_critical)
+    )
+    return dimensions.astype(np.int16)
+
+
+def settled_particles(entropy, dimensions):
+    """
+    Particle count a system settles at when started from reset.
+
+    update_physics only creates particles above the Goldilocks threshold, and
+    then keeps going until the per-dimension cap is reached.
+    """
+    cap = dimensions.astype(np.int32) * EntropicPhysicsSystem.PARTICLES_PER_DIMENSION
+    return np.where(np.asarray(entropy) > GOLDILOCKS_MIN, cap, 0)
+
+
+@lru_cache(maxsize=1 << 16)
+def _rule_holds(rule_set, index, args):
+    """Memoized evaluation of one rule predicate on one combination of input values."""
+    _, _, predicate = RULE_SETS[rule_set][index]
+    return bool(predicate(*args))
+
+
+def _rule_grid(rule_set, index, state):
+    """
+    Evaluates one rule over the whole grid.
+
+    state maps each rule input to an array broadcastable to the grid, e.g.
+    coupling varies only along its own axis. A rule is evaluated once per
+    distinct combination of the values of its own inputs, then the results
+    are scattered back over the grid by index.
+    """
+    _, inputs, _ = RULE_SETS[rule_set][index]
+    uniques, inverses = [], []
+    for key in inputs:
+        values, inverse = np.unique(state[key], return_inverse=True)
+        uniques.append(values.tolist())
+        inverses.append(inverse.reshape(np.shape(state[key])))
+    table = np.array(
+        [_rule_holds(rule_set, index, args) for args in itertools.product(*uniques)], dtype=bool
+    ).reshape([len(values) for values in uniques])
+    return table[tuple(inverses)]
+
+
+def _rule_mask(rule_set, state, shape):
+    """Packs every rule of a rule set into a uint8 bitmask grid (bit i = rule i)."""
+    mask = np.zeros(shape, dtype=np.uint8)
+    for index in range(len(RULE_SETS[rule_set])):
+        mask |= (_rule_grid(rule_set, index, state) << index).astype(np.uint8)
+    return mask
+
+
+def _phase_slab(task):
+    """Worker entry point: evaluates the full entropy x consciousness plane for a slice of couplings."""
+    entropy, coupling, consciousness = task
+    dimensions = dimensions_grid(entropy)
+    shape = (len(entropy), len(coupling), len(consciousness))
+    state = {
+        'entropy': entropy[:, None, None],
+        'dimensions': dimensions[:, None, None],
+        'particles': settled_particles(entropy, dimensions)[:, None, None],
+        'coupling': coupling[None, :, None],
+        'consciousness': consciousness[None, None, :],
+    }
+    forces = _rule_mask('forces', state, shape)
+    # Anomaly rules may look at how many forces are active
+    state['forces'] = sum((forces >> index) & 1 for index in range(len(FORCE_RULES)))
+    anomalies = _rule_mask('anomalies', state, shape)
+
+    return np.broadcast_to(dimensions[:, None, None], shape).copy(), forces, anomalies
+
+
+def compute_phase_diagram(entropy, coupling, consciousness, workers=1):
+    """
+    Evaluates the parameter -> (dimensions, forces, anomalies) map over a 3-D grid.
+
+    Each point is the state a system settles at when its parameters are held
+    at that point: dimensions from the entropy formula, particles at their
+    cap above the Goldilocks threshold, then the force and anomaly rules.
+    The coupling axis is split across `workers` processes (None uses every core).
+
+    Returns a dict of arrays indexed [entropy, coupling, consciousness]:
+    'dimensions' (int16), 'forces' and 'anomalies' (uint8 bitmasks over
+    FORCE_NAMES and ANOMALY_NAMES), plus the three axes and the bit names.
+    """
+    entropy = np.asarray(entropy, dtype=float).reshape(-1)
+    coupling = np.asarray(coupling, dtype=float).reshape(-1)
+    consciousness = np.asarray(consciousness, dtype=float).reshape(-1)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    slices = np.array_split(coupling, min(len(coupling), max(1, workers) * 4))
+    tasks = [(entropy, part, consciousness) for part in slices if len(part)]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            slabs = list(executor.map(_phase_slab, tasks))
+    else:
+        slabs = [_phase_slab(task) for task in tasks]
+
+    return {
+        'entropy': entropy,
+        'coupling': coupling,
+        'consciousness': consciousness,
+        'dimensions': np.concatenate([slab[0] for slab in slabs], axis=1),
+        'forces': np.concatenate([slab[1] for slab in slabs], axis=1),
+        'anomalies': np.concatenate([slab[2] for slab in slabs], axis=1),
+        'force_names': np.array(FORCE_NAMES),
+        'anomaly_names': np.array(ANOMALY_NAMES),
+    }
+
+
+def save_phase_diagram(path, diagram):
+    """Writes a phase diagram to a compressed .npz file."""
+    np.savez_compressed(path, **diagram)
+
+
+def load_phase_diagram(path):
+    """Reads a phase diagram written by save_phase_diagram back into a dict of arrays."""
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Phase diagram of the entropic physics rules.")
+    parser.add_argument('--entropy', type=float, nargs=3, default=(0.0, 2.0, 201), metavar=('START', 'STOP', 'NUM'))
+    parser.add_argument('--coupling', type=float, nargs=3, default=(0.0, 5.0, 101), metavar=('START', 'STOP', 'NUM'))
+    parser.add_argument('--consciousness', type=float, nargs=3, default=(0.0, 1.0, 101),
+                        metavar=('START', 'STOP', 'NUM'))
+    parser.add_argument('--workers', type=int, default=0, help="Worker processes (0 = all cores)")
+    parser.add_argument('--output', default='phase_diagram.npz')
+    args = parser.parse_args()
+
+    axes = [np.linspace(start, stop, int(num)) for start, stop, num in (args.entropy, args.coupling, args.consciousness)]
+    start = time.perf_counter()
+    diagram = compute_phase_diagram(*axes, workers=args.workers or None)
+    save_phase_diagram(args.output, diagram)
+    points = diagram['dimensions'].size
+    print(f"Evaluated {points:,d} grid points in {time.perf_counter() - start:.2f}s -> {args.output}")
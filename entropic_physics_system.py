@@ -1,9 +1,20 @@
 import time
+import json
 import math
 import random
 import os
+import select
+import sys
 import threading
-from collections import deque
+import tracemalloc
+from array import array
+from collections import Counter, deque, namedtuple
+from types import MappingProxyType
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it only speeds up aggregate queries
+    np = None
 
 # --- ANSI Color Codes for Terminal Styling ---
 class Colors:
@@ -17,19 +28,640 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# --- Physics Rules ---
+# Entropy bounds of the Goldilocks zone of stable 4D physics
+GOLDILOCKS_MIN = 0.4773
+GOLDILOCKS_MAX = 0.8452
+MAX_DIMENSIONS = 458
+
+# Rules are (name, state inputs, predicate over those inputs). The state
+# inputs are 'dimensions', 'particles' (count), 'entropy', 'coupling',
+# 'consciousness' and, for anomalies, 'forces' (count of active forces).
+FORCE_RULES = (
+    # Check for quantum entanglement
+    ("Quantum Entanglement", ('dimensions', 'particles'), lambda dimensions, particles: dimensions > 5 and particles > 1),
+    # Check for emergent gravity
+    ("Emergent Gravity", ('coupling',), lambda coupling: coupling > 2.5),
+    # Check for consciousness field coupling
+    ("Consciousness Field", ('consciousness',), lambda consciousness: consciousness > 0.8),
+    # Check for novel forces in high dimensions
+    ("Ghost Force", ('dimensions',), lambda dimensions: dimensions > 100),
+)
+ANOMALY_RULES = (
+    ("High-dimensional space with few particles - potential instability",
+     ('dimensions', 'particles'), lambda dimensions, particles: dimensions > 50 and particles < 5),
+    ("High coupling but no emergent forces - investigating",
+     ('coupling', 'forces'), lambda coupling, forces: coupling > 4 and forces == 0),
+)
+
+# Bit i of a force (anomaly) mask stands for FORCE_NAMES[i] (ANOMALY_NAMES[i])
+FORCE_NAMES = tuple(name for name, _, _ in FORCE_RULES)
+ANOMALY_NAMES = tuple(name for name, _, _ in ANOMALY_RULES)
+
+def compute_dimensions(entropy):
+    """Dimensional emergence: the number of active dimensions for an entropy value."""
+    if entropy < GOLDILOCKS_MIN:
+        return max(1, math.floor(entropy * 8.4))
+    elif entropy < GOLDILOCKS_MAX:
+        # Goldilocks zone for stable 4D
+        return 4 + math.floor((entropy - GOLDILOCKS_MIN) * 15)
+    else:
+        # Exponential scaling for higher dimensions
+        return min(MAX_DIMENSIONS, 4 + math.floor(math.pow((entropy - GOLDILOCKS_MIN), 1.8) * 180))
+
+def evaluate_rules(rules, state):
+    """Returns the names of the rules whose predicate holds for the state dict, in rule order."""
+    return [name for name, inputs, predicate in rules if predicate(*(state[key] for key in inputs))]
+
+def rules_by_input(rules):
+    """Maps each state input to the indices of the rules that read it."""
+    dependents = {}
+    for index, (_, inputs, _) in enumerate(rules):
+        for key in inputs:
+            dependents.setdefault(key, []).append(index)
+    return dependents
+
+FORCE_RULE_DEPENDENTS = rules_by_input(FORCE_RULES)
+
+# --- Change Tracking and Events ---
+class TrackedParameters(dict):
+    """A parameter dict that remembers which keys changed value since pop_changes() was last called."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changed = set(self)
+
+    def __setitem__(self, key, value):
+        if key not in self or self[key] != value:
+            self.changed.add(key)
+        super().__setitem__(key, value)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def pop_changes(self):
+        """Returns the changed keys and starts tracking afresh."""
+        changed, self.changed = self.changed, set()
+        return changed
+
+class EventBus:
+    """
+    Queues simulation events and delivers them to subscribers on flush().
+
+    Events without subscribers are dropped at publish time, so an event
+    costs nothing unless something listens to it. Callbacks receive the
+    event payload as keyword arguments and may publish further events;
+    those are delivered in the same flush.
+    """
+    def __init__(self):
+        self.subscribers = {}
+        self.pending = deque()
+
+    def subscribe(self, event_type, callback):
+        self.subscribers.setdefault(event_type, []).append(callback)
+
+    def unsubscribe(self, event_type, callback):
+        self.subscribers.get(event_type, []).remove(callback)
+
+    def publish(self, event_type, **payload):
+        if self.subscribers.get(event_type):
+            self.pending.append((event_type, payload))
+
+    def flush(self):
+        """Delivers every queued event, in publication order."""
+        while self.pending:
+            event_type, payload = self.pending.popleft()
+            for callback in list(self.subscribers.get(event_type, ())):
+                callback(**payload)
+
+# --- Particle Storage ---
+class ParticleStore:
+    """
+    Structure-of-arrays particle storage with typed id, dimension and energy columns.
+
+    Columns are stdlib arrays, so appends grow in amortized O(1) and each
+    particle costs 18 bytes instead of a dict. It keeps the list-of-dicts
+    interface callers rely on (len, iteration, indexing and append of
+    {'id', 'dimension', 'energy'} dicts) and adds aggregate queries that run
+    over whole columns.
+    """
+    def __init__(self):
+        self.ids = array('q')
+        self.dimensions = array('H')
+        self.energies = array('d')
+
+    def add(self, particle_id, dimension, energy):
+        """Appends one particle to the columns."""
+        self.ids.append(particle_id)
+        self.dimensions.append(dimension)
+        self.energies.append(energy)
+
+    def append(self, particle):
+        """List-compatible append of a particle dict."""
+        self.add(particle['id'], particle['dimension'], particle['energy'])
+
+    def clear(self):
+        """Removes every particle."""
+        del self.ids[:], self.dimensions[:], self.energies[:]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        return {'id': self.ids[index], 'dimension': self.dimensions[index], 'energy': self.energies[index]}
+
+    def __iter__(self):
+        for particle_id, dimension, energy in zip(self.ids, self.dimensions, self.energies):
+            yield {'id': particle_id, 'dimension': dimension, 'energy': energy}
+
+    @property
+    def nbytes(self):
+        """Bytes used by the particle columns."""
+        return sum(column.itemsize * len(column) for column in (self.ids, self.dimensions, self.energies))
+
+    def total_energy(self):
+        """Sum of all particle energies."""
+        if np is not None:
+            return float(np.frombuffer(self.energies, dtype=np.float64).sum())
+        return math.fsum(self.energies)
+
+    def dimension_histogram(self):
+        """Returns {dimension: particle count} for every occupied dimension."""
+        if np is not None:
+            counts = np.bincount(np.frombuffer(self.dimensions, dtype=np.uint16))
+            return {int(dimension): int(counts[dimension]) for dimension in np.flatnonzero(counts)}
+        return dict(sorted(Counter(self.dimensions).items()))
+
+    def energy_by_dimension(self):
+        """Returns {dimension: total energy} for every occupied dimension."""
+        if np is not None:
+            dimensions = np.frombuffer(self.dimensions, dtype=np.uint16)
+            totals = np.bincount(dimensions, weights=np.frombuffer(self.energies, dtype=np.float64))
+            return {int(dimension): float(totals[dimension]) for dimension in np.unique(dimensions)}
+        totals = {}
+        for dimension, energy in zip(self.dimensions, self.energies):
+            totals[dimension] = totals.get(dimension, 0.0) + energy
+        return dict(sorted(totals.items()))
+
+    def as_arrays(self):
+        """
+        Returns NumPy copies of the (ids, dimensions, energies) columns.
+
+        Copies rather than views: an array exporting its buffer cannot grow,
+        so handing out live views would block further appends.
+        """
+        if np is None:
+            raise ImportError("ParticleStore.as_arrays requires NumPy to be installed.")
+        return (np.array(self.ids, dtype=np.int64), np.array(self.dimensions, dtype=np.uint16),
+                np.array(self.energies, dtype=np.float64))
+
+# --- Event Log ---
+# A log entry is stored as (timestamp, event type, parameters); its text is
+# only produced when something displays or exports it
+LogRecord = namedtuple('LogRecord', ['timestamp', 'event', 'params'])
+
+# Per event type: (ANSI color prefix, message template over the parameters)
+LOG_TEMPLATES = {
+    'message': ("", "{text}"),
+    'reset': ("", "Physics system reset to initial conditions."),
+    'simulation_started': ("", "Simulation started - physics calculations active."),
+    'simulation_paused': ("", "Simulation paused."),
+    'dimensional_transition': (Colors.BOLD + Colors.HEADER, "DIMENSIONAL PHASE TRANSITION: {old_dim}D -> {new_dim}D"),
+    'discovery': (Colors.YELLOW, "Discovery: {discovery}"),
+    'forces_added': (Colors.CYAN, "Emergent force detected: {forces}"),
+    'forces_removed': ("", "Force dissipated: {forces}"),
+    'experiment_result': (Colors.GREEN, "Experiment Result: {result}"),
+    'parameters_injected': ("", "Novel physics injected: ω={entropy:.2f}, Γ={coupling:.2f}, C={consciousness:.2f}"),
+    'profiling_enabled': ("", "Profiling enabled - timing and allocation tracing active."),
+    'profiling_paused': ("", "Profiling paused."),
+    'metrics_exported': ("", "Metrics snapshot exported to {path}"),
+    'no_metrics': (Colors.RED, "No metrics yet - enable profiling with [7] first."),
+    'unknown_command': (Colors.RED, "Unknown command: '{command}'"),
+}
+
+class EventLog:
+    """
+    Bounded ring buffer of structured log records.
+
+    Appending stores a timestamp, an event type and its parameters, with no
+    string formatting. render() turns a record into display text on demand.
+    With a spill_path, records evicted from the ring are appended to that
+    file as JSON lines, so the full history survives while memory stays
+    bounded; export() writes the complete history back out. The first spill
+    truncates the file, so it only ever holds this log's records.
+    """
+    def __init__(self, capacity=1000, spill_path=None):
+        self.records = deque(maxlen=capacity)
+        self.spill_path = spill_path
+        self.spill_file = None
+        self.spilled = False
+        self.total = 0
+
+    def append(self, event, params):
+        if self.spill_path is not None and len(self.records) == self.records.maxlen:
+            self._spill(self.records[0])
+        self.records.append(LogRecord(time.time(), event, params))
+        self.total += 1
+
+    def _spill(self, record):
+        if self.spill_file is None:
+            # Start over on the first spill; reopen for appending after a close()
+            self.spill_file = open(self.spill_path, 'a' if self.spilled else 'w', encoding='utf-8')
+            self.spilled = True
+        self.spill_file.write(json.dumps(record._asdict(), ensure_ascii=False) + "\n")
+
+    def tail(self, count):
+        """The most recent count records, oldest first."""
+        records = self.records
+        return tuple(records[i] for i in range(max(0, len(records) - count), len(records)))
+
+    def history(self):
+        """Every record still available: spilled ones first, then the in-memory ring."""
+        if self.spill_file is not None:
+            self.spill_file.flush()
+        if self.spilled:
+            with open(self.spill_path, encoding='utf-8') as f:
+                for line in f:
+                    yield LogRecord(**json.loads(line))
+        yield from tuple(self.records)
+
+    @staticmethod
+    def render(record, color=True, clock=True):
+        """Formats one record as a '[HH:MM:SS] message' line, or just the message without clock."""
+        prefix, template = LOG_TEMPLATES[record.event]
+        params = {key: ', '.join(value) if isinstance(value, (list, tuple)) else value
+                  for key, value in record.params.items()}
+        text = template.format(**params)
+        if color and prefix:
+            text = f"{prefix}{text}{Colors.ENDC}"
+        if not clock:
+            return text
+        return f"[{time.strftime('%H:%M:%S', time.localtime(record.timestamp))}] {text}"
+
+    def export(self, path, color=False):
+        """Writes the full history as text lines."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in self.history():
+                f.write(self.render(record, color) + "\n")
+
+    def close(self):
+        """Closes the spill file; spilled records stay readable through history()."""
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
+
+# --- Fixed-Timestep Scheduling ---
+# Per-tick chances in the rules were tuned for one tick every REFERENCE_TICK
+# seconds of simulated time; other timesteps rescale them (see chance_per_step)
+REFERENCE_TICK = 0.5
+
+def chance_per_step(reference_chance, delta_time):
+    """Rescales a per-REFERENCE_TICK probability to a step of delta_time simulated seconds."""
+    if delta_time == REFERENCE_TICK:
+        return reference_chance
+    return 1 - (1 - reference_chance) ** (delta_time / REFERENCE_TICK)
+
+class FixedTimestepScheduler:
+    """
+    Runs simulation steps at a fixed timestep, independent of wall-clock jitter.
+
+    Every step advances simulated time by exactly `timestep`. When the loop
+    falls behind, advance() catches up with at most max_substeps steps per
+    call. Any remaining backlog is dropped and counted as an overrun, so a
+    slow machine runs the simulation slower instead of spiralling.
+    """
+    MIN_RATE = 2.0
+    MAX_RATE = 1000.0
+
+    def __init__(self, rate_hz=2.0, max_substeps=5, history=1000):
+        if not self.MIN_RATE <= rate_hz <= self.MAX_RATE:
+            raise ValueError(f"Tick rate must be between {self.MIN_RATE:g} and {self.MAX_RATE:g} Hz, got {rate_hz}.")
+        self.rate_hz = rate_hz
+        self.timestep = 1.0 / rate_hz
+        self.max_substeps = max_substeps
+        self.next_tick = None
+        self.ticks = 0
+        self.overruns = 0
+        self.tick_durations = deque(maxlen=history)
+        self.jitter = deque(maxlen=history)
+
+    def start(self, now):
+        """Schedules the first step for `now` (a time.perf_counter value)."""
+        self.next_tick = now
+
+    def advance(self, step, clock=time.perf_counter):
+        """
+        Calls step(timestep) for every tick that is due, up to max_substeps.
+
+        Returns the number of wall-clock seconds until the next tick is due.
+        """
+        now = clock()
+        substeps = 0
+        while now >= self.next_tick and substeps < self.max_substeps:
+            # How late this tick started relative to its slot
+            self.jitter.append(now - self.next_tick)
+            step(self.timestep)
+            finished = clock()
+            self.tick_durations.append(finished - now)
+            self.ticks += 1
+            self.next_tick += self.timestep
+            substeps += 1
+            now = finished
+        if now >= self.next_tick:
+            # Still behind after the catch-up budget: drop the backlog
+            self.overruns += 1
+            self.next_tick = now + self.timestep
+        return self.next_tick - now
+
+    def metrics(self):
+        """Tick duration and jitter statistics (milliseconds) plus counters."""
+        durations = sorted(tuple(self.tick_durations))
+        jitter = sorted(tuple(self.jitter))
+
+        def summary(values):
+            if not values:
+                return 0.0, 0.0, 0.0
+            p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+            return sum(values) / len(values) * 1000, p95 * 1000, values[-1] * 1000
+
+        mean_tick, p95_tick, max_tick = summary(durations)
+        mean_jitter, p95_jitter, max_jitter = summary(jitter)
+        return {
+            'rate_hz': self.rate_hz,
+            'ticks': self.ticks,
+            'overruns': self.overruns,
+            'tick_mean_ms': mean_tick,
+            'tick_p95_ms': p95_tick,
+            'tick_max_ms': max_tick,
+            'jitter_mean_ms': mean_jitter,
+            'jitter_p95_ms': p95_jitter,
+            'jitter_max_ms': max_jitter,
+        }
+
+# --- State Snapshots ---
+# An immutable, versioned copy of everything the UI shows. The physics thread
+# builds a new one after every tick and swaps it in with a single reference
+# assignment, so readers always see one complete tick without taking a lock.
+StateSnapshot = namedtuple('StateSnapshot', [
+    'version', 'is_running', 'sim_time', 'dimensions', 'particle_count', 'forces', 'parameters',
+    'discoveries', 'log_records', 'conversation_history',
+])
+
+def snapshot_state(snapshot):
+    """JSON-ready view of a StateSnapshot."""
+    return {
+        'version': snapshot.version,
+        'is_running': snapshot.is_running,
+        'sim_time': snapshot.sim_time,
+        'dimensions': snapshot.dimensions,
+        'particles': snapshot.particle_count,
+        'forces': list(snapshot.forces),
+        'parameters': dict(snapshot.parameters),
+        'discoveries': len(snapshot.discoveries),
+        'log': [EventLog.render(record, color=False) for record in snapshot.log_records],
+        'conversation': [f"{entry['name']}: {entry['message']}" for entry in snapshot.conversation_history[-3:]],
+    }
+
+# --- Terminal Rendering ---
+class TerminalRenderer:
+    """
+    Diff-based terminal renderer with frame-time statistics.
+
+    Keeps the previous frame and rewrites only the lines that changed, using
+    ANSI cursor addressing instead of clearing the screen. The prompt sits
+    below the frame, and the cursor is saved and restored around every
+    update so text being typed there is left alone.
+    """
+    PROMPT = "Enter command: "
+
+    def __init__(self, stream=None, fps=10, history=600):
+        self.stream = stream if stream is not None else sys.stdout
+        self.fps = fps
+        self.frame_interval = 1.0 / fps
+        self.previous = None
+        self.frame_times = deque(maxlen=history)
+        self.frames = 0
+        self.over_budget = 0
+
+    def invalidate(self):
+        """Forces the next draw to repaint the whole screen."""
+        self.previous = None
+
+    def draw(self, lines, frame_start=None):
+        """
+        Writes the frame, touching only rows that differ from the previous one.
+
+        frame_start is when building the frame began (time.perf_counter), so
+        frame times can cover building as well as writing.
+        """
+        start = frame_start if frame_start is not None else time.perf_counter()
+        out = []
+        if self.previous is None:
+            # Clear the screen and home the cursor, then paint everything plus the prompt
+            out.append("\033[2J\033[H")
+            out.append("\n".join(lines))
+            out.append(f"\n\n{self.PROMPT}")
+        else:
+            out.append("\0337")  # Save the cursor, which sits at the prompt
+            for row, line in enumerate(lines):
+                if row >= len(self.previous) or line != self.previous[row]:
+                    out.append(f"\033[{row + 1};1H{line}\033[K")
+            for row in range(len(lines), len(self.previous)):
+                out.append(f"\033[{row + 1};1H\033[K")
+            out.append("\0338")  # Back to the prompt
+        self.stream.write("".join(out))
+        self.stream.flush()
+        self.previous = list(lines)
+
+        elapsed = time.perf_counter() - start
+        self.frame_times.append(elapsed)
+        self.frames += 1
+        if elapsed > self.frame_interval:
+            self.over_budget += 1
+
+    def read_command(self, timeout):
+        """
+        Returns a submitted command line, or None if none arrived within timeout.
+
+        End of input counts as 'q'. Where stdin cannot be polled (Windows),
+        this falls back to a blocking read.
+        """
+        if os.name != 'nt':
+            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+            if not ready:
+                return None
+        line = sys.stdin.readline()
+        return line if line else 'q'
+
+    def stats(self):
+        """Frame-time statistics over the recent frame history, in milliseconds."""
+        times = sorted(self.frame_times)
+        if not times:
+            return {'frames': 0, 'mean_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0,
+                    'budget_ms': self.frame_interval * 1000, 'over_budget': 0}
+        return {
+            'frames': self.frames,
+            'mean_ms': sum(times) / len(times) * 1000,
+            'p95_ms': times[min(len(times) - 1, int(len(times) * 0.95))] * 1000,
+            'max_ms': times[-1] * 1000,
+            'budget_ms': self.frame_interval * 1000,
+            'over_budget': self.over_budget,
+        }
+
+# --- Instrumentation ---
+class Profiler:
+    """
+    Optional call metrics for the hot methods of a live EntropicPhysicsSystem.
+
+    enable() shadows each method in METHODS with a timing wrapper on the
+    instance. disable() deletes the wrappers so the class methods are used
+    again. A system that was never profiled, or was profiled and then
+    disabled, pays nothing. With trace_memory, tracemalloc also records the
+    net allocation of every call. Timings and allocations are inclusive of
+    nested instrumented calls (update_physics includes create_particle).
+    """
+    METHODS = ('update_physics', 'create_particle', 'detect_emergent_forces', 'generate_ai_response', 'display')
+
+    def __init__(self, system, trace_memory=False, history=1024):
+        self.system = system
+        self.trace_memory = trace_memory
+        self.started_tracemalloc = False
+        self.history = history
+        self.stats = {}
+        self.enabled = False
+
+    def enable(self):
+        if self.enabled:
+            return
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracemalloc = True
+        for name in self.METHODS:
+            stats = self.stats.setdefault(name, {'calls': 0, 'total': 0.0, 'allocated': 0,
+                                                 'durations': deque(maxlen=self.history)})
+            setattr(self.system, name, self._wrap(getattr(self.system, name), stats))
+        self.enabled = True
+
+    def disable(self):
+        if not self.enabled:
+            return
+        for name in self.METHODS:
+            delattr(self.system, name)
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+            self.started_tracemalloc = False
+        self.enabled = False
+
+    def _wrap(self, method, stats):
+        clock = time.perf_counter
+        trace_memory = self.trace_memory
+
+        def timed(*args, **kwargs):
+            if trace_memory:
+                memory_before = tracemalloc.get_traced_memory()[0]
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                stats['calls'] += 1
+                stats['total'] += elapsed
+                stats['durations'].append(elapsed)
+                if trace_memory:
+                    stats['allocated'] += tracemalloc.get_traced_memory()[0] - memory_before
+        return timed
+
+    def snapshot(self):
+        """Metrics per method: call count, cumulative/mean/percentile times (ms) and net allocation (bytes)."""
+        methods = {}
+        for name, stats in self.stats.items():
+            durations = sorted(tuple(stats['durations']))
+
+            def percentile(fraction):
+                return durations[min(len(durations) - 1, int(len(durations) * fraction))] * 1000 if durations else 0.0
+
+            methods[name] = {
+                'calls': stats['calls'],
+                'total_ms': stats['total'] * 1000,
+                'mean_ms': stats['total'] / stats['calls'] * 1000 if stats['calls'] else 0.0,
+                'p50_ms': percentile(0.50),
+                'p95_ms': percentile(0.95),
+                'p99_ms': percentile(0.99),
+                'allocated_bytes': stats['allocated'] if self.trace_memory else None,
+            }
+        memory = tracemalloc.get_traced_memory() if self.trace_memory and tracemalloc.is_tracing() else None
+        return {
+            'timestamp': time.time(),
+            'enabled': self.enabled,
+            'methods': methods,
+            'traced_memory_bytes': memory[0] if memory else None,
+            'traced_peak_bytes': memory[1] if memory else None,
+        }
+
+    def export(self, path):
+        """Writes the current metrics snapshot as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+# --- Commands ---
+# Readable names for the menu keys, accepted wherever a command is
+COMMAND_ALIASES = {
+    'toggle': '1',
+    'reset': '2',
+    'inject': '3',
+    'bell_test': '4',
+    'consciousness_collapse': '5',
+    'goldilocks_mapping': '6',
+    'profiling': '7',
+    'metrics': '8',
+    'export_metrics': '9',
+    'quit': 'q',
+}
+
 # --- Main Physics System Class ---
 class EntropicPhysicsSystem:
     """
     A terminal-based simulation of the Entropic Framework Physics Discovery System.
     This class manages the physics state, AI discussions, and user interaction.
+
+    Passing a seed makes every random draw come from a per-instance RNG, so a
+    headless run (see run_headless) is fully reproducible. tick_rate sets how
+    many fixed simulation steps per second the background loop runs. The
+    event log keeps log_capacity records in memory; with log_spill_path,
+    older records are kept on disk instead of being dropped. With
+    threaded=False, starting the simulation spawns no thread: the host is
+    expected to drive the scheduler itself (see entropic_server).
     """
-    def __init__(self):
+    # Particle cap per active dimension
+    PARTICLES_PER_DIMENSION = 2
+    # Log lines shown in the System Log panel
+    LOG_LINES = 10
+
+    def __init__(self, seed=None, tick_rate=2.0, log_capacity=1000, log_spill_path=None, threaded=True):
+        self.rng = random.Random(seed)
+        self.threaded = threaded
+        self.scheduler = FixedTimestepScheduler(tick_rate)
         self.is_running = False
         self.simulation_thread = None
-        self.last_timestamp = 0
+        # Writers (the physics thread and commands) serialize on state_lock and
+        # publish a StateSnapshot; readers only ever look at self.snapshot
+        self.state_lock = threading.RLock()
+        self.stop_event = threading.Event()
+        self.snapshot = None
         self.conversation_history = deque(maxlen=20)
         self.discoveries = []
-        self.log_messages = deque(maxlen=10)
+        self.event_log = EventLog(log_capacity, log_spill_path)
+        self.renderer = None
+        self.profiler = None
+        self.show_metrics = False
+        self.field = None
+        self.metrics_path = 'entropic_metrics.json'
+
+        # Rule-engine outputs are published here; commentary and logging listen in
+        self.events = EventBus()
+        self.events.subscribe('dimensional_transition', self.on_dimensional_transition)
+        self.events.subscribe('force_added', self.on_forces_added)
+        self.events.subscribe('force_removed', self.on_forces_removed)
 
         self.ai_personalities = {
             'quantum': {"name": "Dr. Quantum", "color": Colors.RED, "specialty": "Quantum Field Specialist"},
@@ -43,51 +675,118 @@ class EntropicPhysicsSystem:
         """Resets the simulation to its initial default state."""
         if self.is_running:
             self.toggle_simulation()
-            
+
+        with self.state_lock:
+            self._reset_state()
+            self.publish_snapshot()
+
+    def _reset_state(self):
+        """Restores the initial physics state. Callers hold state_lock."""
+        self.sim_time = 0.0
         self.dimensions = 4
-        self.particles = []
+        self.particles = ParticleStore()
         self.forces = []
         self.ghost_variables = {}
+        # Per-rule results and the derived inputs they were last evaluated against
+        self.force_rule_states = [False] * len(FORCE_RULES)
+        self.rule_inputs_seen = {}
         
-        self.current_parameters = {
+        self.current_parameters = TrackedParameters({
             'entropy': 0.75,
             'coupling': 1.618,
             'consciousness': 0.5
-        }
-        self.log("Physics system reset to initial conditions.")
+        })
+        self.events.pending.clear()
+        self.events.publish('reset')
+        self.log_event('reset')
         self.generate_ai_response('system_reset')
 
     def toggle_simulation(self):
         """Starts or stops the physics simulation loop."""
-        self.is_running = not self.is_running
-        if self.is_running:
-            self.last_timestamp = time.time()
-            self.simulation_thread = threading.Thread(target=self.physics_loop, daemon=True)
-            self.simulation_thread.start()
-            self.log("Simulation started - physics calculations active.")
-            self.generate_ai_response('simulation_started')
+        if not self.is_running:
+            with self.state_lock:
+                self.is_running = True
+                self.stop_event.clear()
+                self.scheduler.start(time.perf_counter())
+                if self.threaded:
+                    self.simulation_thread = threading.Thread(target=self.physics_loop, daemon=True)
+                    self.simulation_thread.start()
+                self.log_event('simulation_started')
+                self.generate_ai_response('simulation_started')
+                self.publish_snapshot()
         else:
-            if self.simulation_thread:
-                self.simulation_thread.join(timeout=1)
-            self.log("Simulation paused.")
-            self.generate_ai_response('simulation_stopped')
+            # Wake the loop out of its wait; it finishes at most the tick in progress.
+            # The lock is not held here, so that tick can complete.
+            self.is_running = False
+            self.stop_event.set()
+            if self.simulation_thread and self.simulation_thread is not threading.current_thread():
+                self.simulation_thread.join()
+            with self.state_lock:
+                self.log_event('simulation_paused')
+                self.generate_ai_response('simulation_stopped')
+                self.publish_snapshot()
 
     def physics_loop(self):
         """The main loop for updating physics, running in a separate thread."""
-        while self.is_running:
-            timestamp = time.time()
-            delta_time = timestamp - self.last_timestamp
-            self.last_timestamp = timestamp
-            
-            self.update_physics(delta_time)
-            
-            # Trigger AI analysis periodically
-            if random.random() < 0.1: # 10% chance per loop
-                self.analyze_current_state()
-                
-            time.sleep(0.5) # Control update frequency
+        while not self.stop_event.is_set():
+            wait = self.scheduler.advance(self._scheduled_step)
+            # Sleep until the next tick is due; stop and reset interrupt the wait immediately
+            self.stop_event.wait(wait)
+
+    def _scheduled_step(self, delta_time):
+        """One fixed-timestep tick of the background loop."""
+        with self.state_lock:
+            self.step(delta_time)
+            self.publish_snapshot()
+
+    def publish_snapshot(self):
+        """Publishes an immutable copy of the displayed state. Callers hold state_lock."""
+        version = self.snapshot.version + 1 if self.snapshot else 1
+        self.snapshot = StateSnapshot(
+            version=version,
+            is_running=self.is_running,
+            sim_time=self.sim_time,
+            dimensions=self.dimensions,
+            particle_count=len(self.particles),
+            forces=tuple(self.forces),
+            parameters=MappingProxyType(dict(self.current_parameters)),
+            discoveries=tuple(self.discoveries),
+            log_records=self.event_log.tail(self.LOG_LINES),
+            conversation_history=tuple(self.conversation_history),
+        )
+
+    def step(self, delta_time=REFERENCE_TICK):
+        """Advances the simulation by delta_time simulated seconds: physics update plus periodic analysis."""
+        self.sim_time += delta_time
+        self.update_physics(delta_time)
+
+        # Trigger AI analysis periodically
+        if self.rng.random() < chance_per_step(0.1, delta_time): # 10% chance per 0.5 s of simulated time
+            self.analyze_current_state()
+
+        # Close the tick: listeners such as a trajectory recorder see every event first
+        self.events.publish('tick', sim_time=self.sim_time)
+        self.events.flush()
 
-    def update_physics(self, delta_time=0.5):
+    def run_headless(self, num_ticks, delta_time=REFERENCE_TICK):
+        """
+        Runs num_ticks simulation steps back-to-back, without a thread or sleep.
+
+        Returns the trajectory as a dict of per-tick lists: 'dimensions',
+        'particles' (count), 'forces' (tuple of active force names) and
+        'discoveries' (the discoveries made during that tick).
+        """
+        trajectory = {'dimensions': [], 'particles': [], 'forces': [], 'discoveries': []}
+        for _ in range(num_ticks):
+            known_discoveries = len(self.discoveries)
+            self.step(delta_time)
+            trajectory['dimensions'].append(self.dimensions)
+            trajectory['particles'].append(len(self.particles))
+            trajectory['forces'].append(tuple(self.forces))
+            trajectory['discoveries'].append(self.discoveries[known_discoveries:])
+        return trajectory
+
+    def update_physics(self, delta_time=REFERENCE_TICK):
         """
         Calculates the evolution of the physical system based on current parameters.
         This is the core of the simulation.
@@ -95,29 +794,30 @@ class EntropicPhysicsSystem:
         entropy = self.current_parameters['entropy']
         
         # --- Dimensional emergence calculation ---
-        if entropy < 0.4773:
-            new_dimensions = max(1, math.floor(entropy * 8.4))
-        elif entropy < 0.8452:
-            # Goldilocks zone for stable 4D
-            new_dimensions = 4 + math.floor((entropy - 0.4773) * 15)
-        else:
-            # Exponential scaling for higher dimensions
-            new_dimensions = min(458, 4 + math.floor(math.pow((entropy - 0.4773), 1.8) * 180))
+        new_dimensions = compute_dimensions(entropy)
 
         if new_dimensions != self.dimensions:
-            self.on_dimensional_transition(self.dimensions, new_dimensions)
+            self.events.publish('dimensional_transition', old_dim=self.dimensions, new_dim=new_dimensions)
             self.dimensions = new_dimensions
 
         # --- Particle creation ---
-        if entropy > 0.4773 and len(self.particles) < self.dimensions * 2 and random.random() < 0.5:
+        if entropy > GOLDILOCKS_MIN and len(self.particles) < self.dimensions * self.PARTICLES_PER_DIMENSION and self.rng.random() < chance_per_step(0.5, delta_time):
             self.create_particle()
 
         # --- Force emergence detection ---
         self.detect_emergent_forces()
 
+        # --- Field evolution (only with a lattice attached, see entropic_lattice) ---
+        if self.field is not None:
+            self.field.resize(self.dimensions)
+            self.field.step(delta_time, entropy, self.current_parameters['coupling'])
+
+        # Deliver this tick's transitions and force changes to their listeners
+        self.events.flush()
+
     def on_dimensional_transition(self, old_dim, new_dim):
         """Handles the event of a dimensional phase transition."""
-        self.log(f"{Colors.BOLD}{Colors.HEADER}DIMENSIONAL PHASE TRANSITION: {old_dim}D -> {new_dim}D{Colors.ENDC}")
+        self.log_event('dimensional_transition', old_dim=old_dim, new_dim=new_dim)
         discovery = None
         if new_dim == 5 and old_dim == 4:
             discovery = "Quantum effects emerging at 5D threshold!"
@@ -128,50 +828,80 @@ class EntropicPhysicsSystem:
         
         if discovery and discovery not in self.discoveries:
             self.discoveries.append(discovery)
-            self.log(f"{Colors.YELLOW}Discovery: {discovery}{Colors.ENDC}")
+            self.log_event('discovery', discovery=discovery)
+            self.events.publish('discovery', discovery=discovery)
 
         self.generate_ai_response('dimensional_transition', {'old_dim': old_dim, 'new_dim': new_dim})
 
     def create_particle(self):
         """Creates a new particle with random properties."""
-        particle = {
-            'id': len(self.particles) + 1,
-            'dimension': min(self.dimensions, 4 + math.floor(random.random() * max(1, self.dimensions - 4))),
-            'energy': random.random() * self.current_parameters['coupling'],
-        }
-        self.particles.append(particle)
+        dimension = min(self.dimensions, 4 + math.floor(self.rng.random() * max(1, self.dimensions - 4)))
+        energy = self.rng.random() * self.current_parameters['coupling']
+        self.particles.add(len(self.particles) + 1, dimension, energy)
 
     def detect_emergent_forces(self):
-        """Checks for and creates new fundamental forces based on system state."""
-        old_force_count = len(self.forces)
-        self.forces = []
-        
-        # Check for quantum entanglement
-        if self.dimensions > 5 and len(self.particles) > 1:
-            self.forces.append("Quantum Entanglement")
-        # Check for emergent gravity
-        if self.current_parameters['coupling'] > 2.5:
-            self.forces.append("Emergent Gravity")
-        # Check for consciousness field coupling
-        if self.current_parameters['consciousness'] > 0.8:
-            self.forces.append("Consciousness Field")
-        # Check for novel forces in high dimensions
-        if self.dimensions > 100:
-            self.forces.append("Ghost Force")
-            
-        if len(self.forces) > old_force_count:
-            new_forces = self.forces[old_force_count:]
-            self.generate_ai_response('force_emergence', {'new_forces': new_forces})
+        """
+        Checks for and creates new fundamental forces based on system state.
+
+        Only the rules reading an input that changed since the last check are
+        re-evaluated. Forces that appear or vanish are published as
+        'force_added' / 'force_removed' events.
+        """
+        changed = self.current_parameters.pop_changes()
+        derived = {'dimensions': self.dimensions, 'particles': len(self.particles)}
+        for key, value in derived.items():
+            if self.rule_inputs_seen.get(key) != value:
+                changed.add(key)
+        self.rule_inputs_seen = derived
+
+        stale_rules = {index for key in changed for index in FORCE_RULE_DEPENDENTS.get(key, ())}
+        if not stale_rules:
+            return
+
+        state = self.rule_state()
+        for index in stale_rules:
+            _, inputs, predicate = FORCE_RULES[index]
+            self.force_rule_states[index] = predicate(*(state[key] for key in inputs))
+
+        forces = [name for (name, _, _), active in zip(FORCE_RULES, self.force_rule_states) if active]
+        added = [force for force in forces if force not in self.forces]
+        removed = [force for force in self.forces if force not in forces]
+        self.forces = forces
+        if added:
+            self.events.publish('force_added', forces=added)
+        if removed:
+            self.events.publish('force_removed', forces=removed)
+
+    def on_forces_added(self, forces):
+        """Handles newly emerged forces."""
+        self.log_event('forces_added', forces=forces)
+        self.generate_ai_response('force_emergence', {'new_forces': forces})
+
+    def on_forces_removed(self, forces):
+        """Handles forces that are no longer supported by the system state."""
+        self.log_event('forces_removed', forces=forces)
+
+    def rule_state(self):
+        """The state inputs that FORCE_RULES and ANOMALY_RULES are evaluated against."""
+        state = dict(self.current_parameters)
+        state.update(dimensions=self.dimensions, particles=len(self.particles), forces=len(self.forces))
+        return state
 
     def run_experiment(self, experiment_type):
         """Simulates running a specific physics experiment."""
+        with self.state_lock:
+            self._run_experiment(experiment_type)
+            self.publish_snapshot()
+
+    def _run_experiment(self, experiment_type):
+        """Runs the experiment against the current state. Callers hold state_lock."""
         result = ""
         if experiment_type == 'bell_test':
             if self.dimensions < 5:
                 result = "Bell Test requires >4D. Current dimensions: " + str(self.dimensions)
             else:
                 violation_chance = (self.dimensions - 4) * 0.1
-                if random.random() < violation_chance:
+                if self.rng.random() < violation_chance:
                     result = f"Bell Test: VIOLATION DETECTED! Non-locality confirmed in {self.dimensions}D space."
                 else:
                     result = "Bell Test: No violation detected. Correlations consistent with local realism."
@@ -183,39 +913,52 @@ class EntropicPhysicsSystem:
         
         elif experiment_type == 'goldilocks_mapping':
             entropy = self.current_parameters['entropy']
-            if 0.4773 <= entropy <= 0.8452:
+            if GOLDILOCKS_MIN <= entropy <= GOLDILOCKS_MAX:
                 stability = "Stable 4D physics (GOLDILOCKS ZONE)"
-            elif entropy < 0.4773:
+            elif entropy < GOLDILOCKS_MIN:
                 stability = "Sub-critical - Dimensional collapse risk"
             else:
                 stability = "Super-critical - Exponential dimensional expansion"
             result = f"Goldilocks Zone Analysis: ω={entropy:.4f} - {stability}"
         
-        self.log(f"{Colors.GREEN}Experiment Result: {result}{Colors.ENDC}")
+        self.log_event('experiment_result', result=result)
+        self.events.publish('experiment_completed', type=experiment_type, result=result)
         self.generate_ai_response('experiment_completed', {'type': experiment_type, 'result': result})
 
     def inject_random_physics(self):
         """Applies new, random values to the core physics parameters."""
-        self.current_parameters['entropy'] = random.uniform(0, 2)
-        self.current_parameters['coupling'] = random.uniform(0, 5)
-        self.current_parameters['consciousness'] = random.uniform(0, 1)
-        self.log(f"Novel physics injected: ω={self.current_parameters['entropy']:.2f}, Γ={self.current_parameters['coupling']:.2f}, C={self.current_parameters['consciousness']:.2f}")
+        with self.state_lock:
+            self._inject_random_physics()
+            self.publish_snapshot()
+
+    def _inject_random_physics(self):
+        """Draws the new parameters. Callers hold state_lock."""
+        self.current_parameters['entropy'] = self.rng.uniform(0, 2)
+        self.current_parameters['coupling'] = self.rng.uniform(0, 5)
+        self.current_parameters['consciousness'] = self.rng.uniform(0, 1)
+        self.log_event('parameters_injected', **self.current_parameters)
+        self.events.publish('parameters_injected', parameters=dict(self.current_parameters))
         self.generate_ai_response('novel_physics_injection', self.current_parameters)
 
     def log(self, message):
-        """Adds a message to the system log."""
-        timestamp = time.strftime("%H:%M:%S")
-        self.log_messages.append(f"[{timestamp}] {message}")
+        """Adds a free-form message to the system log."""
+        self.log_event('message', text=message)
+
+    def log_event(self, event, **params):
+        """Records a structured log event; its text is rendered only when displayed or exported."""
+        self.event_log.append(event, params)
+
+    @property
+    def log_messages(self):
+        """The rendered text of the lines shown in the System Log panel."""
+        return [EventLog.render(record) for record in self.event_log.tail(self.LOG_LINES)]
 
     def analyze_current_state(self):
         """Periodically runs an analysis to detect anomalies in the physics state."""
-        anomalies = []
-        if self.dimensions > 50 and len(self.particles) < 5:
-            anomalies.append("High-dimensional space with few particles - potential instability")
-        if self.current_parameters['coupling'] > 4 and len(self.forces) == 0:
-            anomalies.append("High coupling but no emergent forces - investigating")
+        anomalies = evaluate_rules(ANOMALY_RULES, self.rule_state())
         
         if anomalies:
+            self.events.publish('anomaly_detected', anomalies=anomalies)
             self.generate_ai_response('anomaly_detected', {'anomalies': anomalies})
 
     # --- AI Response Generation ---
@@ -235,7 +978,7 @@ class EntropicPhysicsSystem:
             if self.conversation_history:
                 last_speaker = self.conversation_history[-1]['ai_key']
                 ai_options.remove(last_speaker)
-            selected_ai_key = random.choice(ai_options)
+            selected_ai_key = self.rng.choice(ai_options)
 
         ai_profile = self.ai_personalities[selected_ai_key]
         message = self.get_contextual_message(selected_ai_key, trigger, context)
@@ -252,55 +995,57 @@ class EntropicPhysicsSystem:
         params = self.current_parameters
         dims = self.dimensions
         
-        # Default messages
-        messages = {
-            'quantum': f"Quantum analysis ongoing: ω={params['entropy']:.3f}, {dims}D, {len(self.particles)} quantum states.",
-            'dimensional': f"Dimensional analysis: {dims}D space, coupling Γ={params['coupling']:.2f}, {len(self.forces)} emergent forces.",
-            'consciousness': f"Consciousness interface analysis: C={params['consciousness']:.2f}, observer effect on {len(self.particles)} quantum systems."
-        }
-
-        # Specific event-driven messages
+        # Only the selected personality's message is formatted: its default,
+        # unless a specific event-driven message applies
         if ai_key == 'quantum':
-            if dims >= 5:
-                messages['quantum'] = f"Quantum coherence confirmed at {dims}D! Entropy ω={params['entropy']:.3f} is maintaining {len(self.particles)} quantum states."
             if trigger == 'force_emergence' and 'new_forces' in context:
-                messages['quantum'] = f"Fascinating! New quantum force detected: {context['new_forces'][0]}. The framework is evolving."
+                message = f"Fascinating! New quantum force detected: {context['new_forces'][0]}. The framework is evolving."
+            elif dims >= 5:
+                message = f"Quantum coherence confirmed at {dims}D! Entropy ω={params['entropy']:.3f} is maintaining {len(self.particles)} quantum states."
+            else:
+                message = f"Quantum analysis ongoing: ω={params['entropy']:.3f}, {dims}D, {len(self.particles)} quantum states."
         
         elif ai_key == 'dimensional':
-            if dims > 70:
-                messages['dimensional'] = f"BREAKTHROUGH: Beyond 70D threshold! We're in uncharted physics territory with {dims} active dimensions."
             if trigger == 'dimensional_transition':
-                messages['dimensional'] = f"Phase transition confirmed: {context['old_dim']}D -> {context['new_dim']}D. Entropy coupling ω={params['entropy']:.3f} is the driver."
+                message = f"Phase transition confirmed: {context['old_dim']}D -> {context['new_dim']}D. Entropy coupling ω={params['entropy']:.3f} is the driver."
+            elif dims > 70:
+                message = f"BREAKTHROUGH: Beyond 70D threshold! We're in uncharted physics territory with {dims} active dimensions."
+            else:
+                message = f"Dimensional analysis: {dims}D space, coupling Γ={params['coupling']:.2f}, {len(self.forces)} emergent forces."
 
         elif ai_key == 'consciousness':
             if params['consciousness'] > 0.7:
-                messages['consciousness'] = f"High consciousness interface (C={params['consciousness']:.2f}) - quantum states are collapsing to classical behavior."
+                message = f"High consciousness interface (C={params['consciousness']:.2f}) - quantum states are collapsing to classical behavior."
             elif params['consciousness'] < 0.3:
-                messages['consciousness'] = f"Low consciousness coupling (C={params['consciousness']:.2f}) - maintaining quantum superposition across {dims} dimensions."
+                message = f"Low consciousness coupling (C={params['consciousness']:.2f}) - maintaining quantum superposition across {dims} dimensions."
+            else:
+                message = f"Consciousness interface analysis: C={params['consciousness']:.2f}, observer effect on {len(self.particles)} quantum systems."
 
-        return messages[ai_key]
+        return message
 
     # --- Display and Main Loop ---
-    def display(self):
-        """Renders the entire UI to the terminal."""
-        os.system('cls' if os.name == 'nt' else 'clear')
-        
+    def render_frame(self):
+        """Builds the entire UI as a list of screen lines from the latest state snapshot."""
+        state = self.snapshot
+        lines = []
+
         # --- Header and Equations ---
-        print(f"{Colors.BOLD}{Colors.HEADER}--- Entropic Framework Physics Discovery System ---{Colors.ENDC}")
-        print(f"{Colors.GREEN}Core Equation: E = ∫ [ρ(χ,τ)·ω·∇σ] dⁿχ")
-        print(f"Lagrangian: ℒ = ½(∂ψ/∂τ)² - V(ψ) - ωρ∇²ψ + Γφη(ψ){Colors.ENDC}\n")
+        lines.append(f"{Colors.BOLD}{Colors.HEADER}--- Entropic Framework Physics Discovery System ---{Colors.ENDC}")
+        lines.append(f"{Colors.GREEN}Core Equation: E = ∫ [ρ(χ,τ)·ω·∇σ] dⁿχ")
+        lines.append(f"Lagrangian: ℒ = ½(∂ψ/∂τ)² - V(ψ) - ωρ∇²ψ + Γφη(ψ){Colors.ENDC}")
+        lines.append("")
 
         # --- Main Panels (using string formatting for layout) ---
         left_width = 70
         right_width = 45
         
         # Prepare content for both panels
-        convo_lines = list(self.conversation_history)
-        log_lines = list(self.log_messages)
+        convo_lines = state.conversation_history
+        log_lines = [EventLog.render(record) for record in state.log_records]
         
         # --- AI Conversation Panel ---
-        print(f"{Colors.BOLD}{'Triad AI Physics Discussion'.ljust(left_width)}{'Real-Time Physics Status'.ljust(right_width)}{Colors.ENDC}")
-        print(f"{Colors.BLUE}{'-'*left_width}{' '}{'-'*right_width}{Colors.ENDC}")
+        lines.append(f"{Colors.BOLD}{'Triad AI Physics Discussion'.ljust(left_width)}{'Real-Time Physics Status'.ljust(right_width)}{Colors.ENDC}")
+        lines.append(f"{Colors.BLUE}{'-'*left_width}{' '}{'-'*right_width}{Colors.ENDC}")
 
         max_lines = 15
         for i in range(max_lines):
@@ -321,83 +1066,297 @@ class EntropicPhysicsSystem:
             right_line = ""
             # --- Simulation Status Panel ---
             if i == 0:
-                right_line = f" Sim State: {Colors.GREEN}Running{Colors.ENDC}" if self.is_running else f" Sim State: {Colors.RED}Paused{Colors.ENDC}"
+                right_line = f" Sim State: {Colors.GREEN}Running{Colors.ENDC}" if state.is_running else f" Sim State: {Colors.RED}Paused{Colors.ENDC}"
             elif i == 2:
-                right_line = f" {Colors.CYAN}Dimensions: {self.dimensions}{Colors.ENDC}"
+                right_line = f" {Colors.CYAN}Dimensions: {state.dimensions}{Colors.ENDC}"
             elif i == 3:
-                right_line = f" {Colors.CYAN}Particles: {len(self.particles)}{Colors.ENDC}"
+                right_line = f" {Colors.CYAN}Particles: {state.particle_count}{Colors.ENDC}"
             elif i == 4:
-                right_line = f" {Colors.CYAN}Emergent Forces: {len(self.forces)}{Colors.ENDC}"
+                right_line = f" {Colors.CYAN}Emergent Forces: {len(state.forces)}{Colors.ENDC}"
             elif i == 6:
-                right_line = f" {Colors.YELLOW}ω (Entropy): {self.current_parameters['entropy']:.3f}{Colors.ENDC}"
+                right_line = f" {Colors.YELLOW}ω (Entropy): {state.parameters['entropy']:.3f}{Colors.ENDC}"
             elif i == 7:
-                right_line = f" {Colors.YELLOW}Γ (Coupling): {self.current_parameters['coupling']:.3f}{Colors.ENDC}"
+                right_line = f" {Colors.YELLOW}Γ (Coupling): {state.parameters['coupling']:.3f}{Colors.ENDC}"
             elif i == 8:
-                right_line = f" {Colors.YELLOW}C (Consciousness): {self.current_parameters['consciousness']:.3f}{Colors.ENDC}"
+                right_line = f" {Colors.YELLOW}C (Consciousness): {state.parameters['consciousness']:.3f}{Colors.ENDC}"
+            elif i == 9:
+                right_line = f" Sim Time: {state.sim_time:.1f}s @ {self.scheduler.rate_hz:g} Hz"
+            elif i == 10 and self.renderer is not None and self.renderer.frame_times:
+                stats = self.renderer.stats()
+                right_line = f" Frame: {stats['mean_ms']:.1f} ms avg, {stats['p95_ms']:.1f} ms p95 @ {self.renderer.fps:g} FPS"
+            elif i == 11 and self.scheduler.ticks:
+                ticks = self.scheduler.metrics()
+                right_line = f" Tick: {ticks['tick_mean_ms']:.2f} ms, jitter {ticks['jitter_p95_ms']:.1f} ms, {ticks['overruns']} overruns"
             
-            print(f"{left_line.ljust(left_width)} | {right_line.ljust(right_width-2)}")
+            lines.append(f"{left_line.ljust(left_width)} | {right_line.ljust(right_width-2)}")
 
-        # --- Log Panel ---
-        print(f"\n{Colors.BOLD}System Log{Colors.ENDC}")
-        print(f"{Colors.BLUE}{'-'*(left_width+right_width+1)}{Colors.ENDC}")
-        for log_entry in log_lines:
-            print(log_entry)
+        # --- Log Panel (or the metrics view in its place) ---
+        lines.append("")
+        if self.show_metrics:
+            lines.append(f"{Colors.BOLD}Performance Metrics{Colors.ENDC}")
+            lines.append(f"{Colors.BLUE}{'-'*(left_width+right_width+1)}{Colors.ENDC}")
+            log_lines = self.metrics_lines()
+        else:
+            lines.append(f"{Colors.BOLD}System Log{Colors.ENDC}")
+            lines.append(f"{Colors.BLUE}{'-'*(left_width+right_width+1)}{Colors.ENDC}")
+        lines.extend(log_lines)
+        # Pad to the full log height so the menu below never moves
+        lines.extend([""] * (self.LOG_LINES - len(log_lines)))
             
         # --- Command Menu ---
-        print(f"\n{Colors.BOLD}Commands:{Colors.ENDC}")
-        print(
+        lines.append("")
+        lines.append(f"{Colors.BOLD}Commands:{Colors.ENDC}")
+        lines.append(
             f"  {Colors.GREEN}[1]{Colors.ENDC} Start/Stop Sim   "
             f"{Colors.GREEN}[2]{Colors.ENDC} Reset Physics      "
             f"{Colors.GREEN}[3]{Colors.ENDC} Inject Novel Physics"
         )
-        print(
+        lines.append(
             f"  {Colors.GREEN}[4]{Colors.ENDC} Run Bell Test    "
             f"{Colors.GREEN}[5]{Colors.ENDC} Run Collapse Test  "
             f"{Colors.GREEN}[6]{Colors.ENDC} Map Goldilocks Zone"
         )
-        print(f"  {Colors.RED}[q]{Colors.ENDC} Quit")
+        lines.append(
+            f"  {Colors.GREEN}[7]{Colors.ENDC} Toggle Profiling "
+            f"{Colors.GREEN}[8]{Colors.ENDC} Show/Hide Metrics  "
+            f"{Colors.GREEN}[9]{Colors.ENDC} Export Metrics"
+        )
+        lines.append(f"  {Colors.RED}[q]{Colors.ENDC} Quit")
+        return lines
+
+    def metrics_lines(self):
+        """Formats the profiler metrics as panel lines."""
+        if self.profiler is None:
+            return ["Profiling is off - press [7] to start collecting metrics."]
+        metrics = self.profiler.snapshot()
+        state = "on" if metrics['enabled'] else "paused"
+        lines = [f"Profiling {state}.  {'method':<24}{'calls':>9}{'total ms':>11}{'mean ms':>10}"
+                 f"{'p95 ms':>9}{'p99 ms':>9}{'alloc KB':>10}"]
+        for name, method in metrics['methods'].items():
+            allocated = f"{method['allocated_bytes'] / 1024:>+10.1f}" if method['allocated_bytes'] is not None else f"{'-':>10}"
+            lines.append(f"{'':<17}{name:<24}{method['calls']:>9}{method['total_ms']:>11.2f}{method['mean_ms']:>10.4f}"
+                         f"{method['p95_ms']:>9.4f}{method['p99_ms']:>9.4f}{allocated}")
+        return lines
+
+    # --- Profiling ---
+    def enable_profiling(self, trace_memory=False):
+        """Starts collecting call metrics; trace_memory adds tracemalloc allocation deltas."""
+        if self.profiler is None or self.profiler.trace_memory != trace_memory:
+            self.disable_profiling()
+            self.profiler = Profiler(self, trace_memory=trace_memory)
+        self.profiler.enable()
+
+    def disable_profiling(self):
+        """Stops collecting call metrics; those gathered so far stay viewable."""
+        if self.profiler is not None:
+            self.profiler.disable()
+
+    def metrics_snapshot(self):
+        """Returns the current metrics snapshot, or None if profiling was never enabled."""
+        return self.profiler.snapshot() if self.profiler is not None else None
+
+    def export_metrics(self, path=None):
+        """Writes the metrics snapshot as JSON to path (default: metrics_path) and returns the path."""
+        path = path or self.metrics_path
+        if self.profiler is None:
+            raise RuntimeError("Profiling has not been enabled, so there are no metrics to export.")
+        self.profiler.export(path)
+        return path
+
+    def display(self):
+        """Renders the entire UI to the terminal, rewriting only the lines that changed."""
+        if self.renderer is None:
+            self.renderer = TerminalRenderer()
+        frame_start = time.perf_counter()
+        self.renderer.draw(self.render_frame(), frame_start)
+
+    def execute_command(self, command):
+        """
+        Runs one menu command. Returns False when the command asks to quit.
+
+        Besides the menu keys, the names in COMMAND_ALIASES are accepted.
+        """
+        command = COMMAND_ALIASES.get(command, command)
+        if command == '1':
+            self.toggle_simulation()
+        elif command == '2':
+            self.reset_physics()
+        elif command == '3':
+            self.inject_random_physics()
+        elif command == '4':
+            self.run_experiment('bell_test')
+        elif command == '5':
+            self.run_experiment('consciousness_collapse')
+        elif command == '6':
+            self.run_experiment('goldilocks_mapping')
+        elif command == '7':
+            with self.state_lock:
+                if self.profiler is not None and self.profiler.enabled:
+                    self.disable_profiling()
+                    self.log_event('profiling_paused')
+                else:
+                    self.enable_profiling(trace_memory=True)
+                    self.log_event('profiling_enabled')
+                self.publish_snapshot()
+        elif command == '8':
+            self.show_metrics = not self.show_metrics
+        elif command == '9':
+            with self.state_lock:
+                if self.profiler is None:
+                    self.log_event('no_metrics')
+                else:
+                    self.log_event('metrics_exported', path=self.export_metrics())
+                self.publish_snapshot()
+        elif command == 'q':
+            if self.is_running:
+                self.toggle_simulation()
+            return False
+        else:
+            with self.state_lock:
+                self.log_event('unknown_command', command=command)
+                self.publish_snapshot()
+        return True
 
-    def run(self):
-        """The main application loop that handles user input and screen refreshes."""
+    def run_script(self, commands, ticks_per_command=0, output=None):
+        """
+        Runs commands back-to-back without rendering, sleeping or reading the keyboard.
+
+        commands is any iterable of lines, such as an open file. Blank lines
+        and lines starting with '#' are skipped, and 'wait N' advances N
+        ticks. Time passes only in simulated ticks: while the simulation is
+        running, every command is followed by ticks_per_command ticks at the
+        scheduler's timestep, so a script replays identically for a given
+        seed. After each command, one JSON line with the state and the log
+        entries it produced is written to output (default stdout); log
+        entries carry no wall-clock time, only the state's sim_time. A
+        simulation still running at the end is paused. Returns the number of
+        commands run.
+        """
+        output = output if output is not None else sys.stdout
+        # Steps are driven from here; a running background thread would race them
+        if self.is_running and self.threaded:
+            self.toggle_simulation()
+        threaded, self.threaded = self.threaded, False
+        try:
+            return self._run_script(commands, ticks_per_command, output)
+        finally:
+            # Stop cleanly so a later run() or toggle starts its own thread again
+            if self.is_running:
+                self.toggle_simulation()
+            self.threaded = threaded
+
+    def _run_script(self, commands, ticks_per_command, output):
+        logged = self.event_log.total
+        executed = 0
+        for line_number, line in enumerate(commands, 1):
+            command = line.strip().lower()
+            if not command or command.startswith('#'):
+                continue
+            ticks = ticks_per_command
+            keep_going = True
+            if command.split()[0] == 'wait':
+                try:
+                    ticks = int(command.split()[1])
+                except (IndexError, ValueError):
+                    raise ValueError(f"Line {line_number}: expected 'wait N', got {line.strip()!r}.") from None
+            else:
+                keep_going = self.execute_command(command)
+            if not self.is_running:
+                ticks = 0
+            for _ in range(ticks):
+                self._scheduled_step(self.scheduler.timestep)
+            executed += 1
+
+            state = snapshot_state(self.snapshot)
+            new_records = self.event_log.tail(min(self.event_log.total - logged, self.event_log.records.maxlen))
+            state['log'] = [EventLog.render(record, color=False, clock=False) for record in new_records]
+            logged = self.event_log.total
+            output.write(json.dumps({'line': line_number, 'command': command, 'ticks': ticks, 'state': state}) + "\n")
+            if not keep_going:
+                break
+        output.flush()
+        return executed
+
+    def run(self, fps=10):
+        """
+        The main application loop that handles user input and screen refreshes.
+
+        The screen is redrawn fps times per second while commands are read
+        without blocking, so the running simulation stays visible between them.
+        """
+        self.renderer = TerminalRenderer(fps=fps)
         try:
             while True:
+                frame_start = time.perf_counter()
                 self.display()
-                
-                # Non-blocking input would be better, but this is simpler for a single script
-                # For real-time updates, one would use libraries like `curses` or `pynput`
-                # This implementation updates the screen after each command.
-                command = input("\nEnter command: ").lower().strip()
-
-                if command == '1':
-                    self.toggle_simulation()
-                elif command == '2':
-                    self.reset_physics()
-                elif command == '3':
-                    self.inject_random_physics()
-                elif command == '4':
-                    self.run_experiment('bell_test')
-                elif command == '5':
-                    self.run_experiment('consciousness_collapse')
-                elif command == '6':
-                    self.run_experiment('goldilocks_mapping')
-                elif command == 'q':
-                    if self.is_running:
-                        self.toggle_simulation()
+
+                # Wait for input only until the next frame is due
+                timeout = max(0.0, self.renderer.frame_interval - (time.perf_counter() - frame_start))
+                command = self.renderer.read_command(timeout)
+                if command is None:
+                    continue
+
+                # The submitted line scrolled the prompt, so repaint from scratch
+                self.renderer.invalidate()
+                if not self.execute_command(command.lower().strip()):
                     print("Shutting down Entropic Framework...")
                     break
-                else:
-                    self.log(f"{Colors.RED}Unknown command: '{command}'{Colors.ENDC}")
-                
-                # A small delay to allow reading the output of the command
-                time.sleep(1)
 
         except KeyboardInterrupt:
-            if self.is_running:
-                self.toggle_simulation()
             print("\nShutdown initiated by user. Goodbye.")
+        finally:
+            self.close()
+
+    def close(self):
+        """Stops the simulation and releases the event log's spill file."""
+        if self.is_running:
+            self.toggle_simulation()
+        self.event_log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def simulate_trajectory(num_ticks, seed=None, parameters=None, delta_time=REFERENCE_TICK):
+    """
+    Builds a fresh seeded system, optionally overrides its parameters, and runs
+    it headless for num_ticks. Convenient for batch runs in CI or analysis jobs.
+    """
+    with EntropicPhysicsSystem(seed=seed) as system:
+        if parameters:
+            system.current_parameters.update(parameters)
+        return system.run_headless(num_ticks, delta_time)
 
 # --- Main Execution ---
 if __name__ == "__main__":
-    system = EntropicPhysicsSystem()
-    system.run()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Entropic Framework Physics Discovery System.")
+    parser.add_argument('--script', metavar='FILE',
+                        help="Run the commands in FILE ('-' for stdin) non-interactively, printing JSON lines")
+    parser.add_argument('--ticks-per-command', type=int, default=1,
+                        help="Simulated ticks after each scripted command while the simulation runs")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--tick-rate', type=float, default=2.0)
+    parser.add_argument('--output', default=None, help="Write the scripted state log here instead of stdout")
+    args = parser.parse_args()
+
+    system = EntropicPhysicsSystem(seed=args.seed, tick_rate=args.tick_rate, threaded=args.script is None)
+    if args.script is None:
+        system.run()
+    else:
+        script = sys.stdin if args.script == '-' else open(args.script, encoding='utf-8')
+        output = open(args.output, 'w', encoding='utf-8') if args.output else None
+        try:
+            system.run_script(script, args.ticks_per_command, output)
+        except ValueError as error:
+            parser.error(str(error))
+        finally:
+            if script is not sys.stdin:
+                script.close()
+            if output is not None:
+                output.close()
+            system.close()
 
@@ -0,0 +1,225 @@
+import os
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional for recording; the reader needs it for memory mapping
+    np = None
+
+from entropic_physics_system import FORCE_NAMES
+
+# --- File Format ---
+# A 16-byte header (magic, record size, reserved) followed by one fixed-width,
+# little-endian, unpadded record per tick. The file is append-only, so a run
+# can be analyzed while it is still being written.
+MAGIC = b'EPSTRAJ1'
+HEADER = struct.Struct('<8sII')
+
+RECORD_FIELDS = (
+    ('tick', 'Q'),
+    ('sim_time', 'd'),
+    ('entropy', 'd'),
+    ('coupling', 'd'),
+    ('consciousness', 'd'),
+    ('dimensions', 'H'),
+    ('particles', 'I'),
+    ('forces', 'B'),   # bitmask over FORCE_NAMES
+    ('events', 'H'),   # bitmask over EVENT_CODES
+)
+RECORD = struct.Struct('<' + ''.join(code for _, code in RECORD_FIELDS))
+
+# Events published on the system's event bus; bit i of a record's event mask
+# means EVENT_CODES[i] happened since the previous tick
+EVENT_CODES = (
+    'dimensional_transition',
+    'force_added',
+    'force_removed',
+    'discovery',
+    'anomaly_detected',
+    'reset',
+    'parameters_injected',
+    'experiment_completed',
+)
+
+if np is not None:
+    RECORD_DTYPE = np.dtype([(name, '<' + code) for name, code in RECORD_FIELDS])
+    assert RECORD_DTYPE.itemsize == RECORD.size
+
+
+class TrajectoryRecorder:
+    """
+    Opt-in per-tick recorder for an EntropicPhysicsSystem.
+
+    Once attached, it listens on the system's event bus. Every 'tick' event
+    packs the parameters, dimensions, particle count, force bitmask and the
+    bitmask of events seen since the previous tick into one fixed-width
+    record. Records collect in a preallocated buffer and reach the file
+    buffer_ticks at a time, so recording costs one struct pack per tick.
+    """
+    def __init__(self, path, buffer_ticks=4096):
+        self.path = path
+        self.buffer = bytearray(RECORD.size * buffer_ticks)
+        self.buffer_ticks = buffer_ticks
+        self.buffered = 0
+        self.tick = 0
+        self.pending_events = 0
+        self.system = None
+        self._handlers = {}
+
+        exists = os.path.exists(path) and os.path.getsize(path) >= HEADER.size
+        self.file = open(path, 'r+b' if exists else 'wb')
+        if exists:
+            magic, record_size, _ = HEADER.unpack(self.file.read(HEADER.size))
+            if magic != MAGIC or record_size != RECORD.size:
+                self.file.close()
+                raise ValueError(f"{path} is not a trajectory file in this format.")
+            # Continue after the last complete record, numbering ticks onwards
+            self.tick = (os.path.getsize(path) - HEADER.size) // RECORD.size
+            self.file.seek(HEADER.size + self.tick * RECORD.size)
+        else:
+            self.file.write(HEADER.pack(MAGIC, RECORD.size, 0))
+
+    def attach(self, system):
+        """Starts recording every tick of the system."""
+        self.detach()
+        self.system = system
+        self._handlers = {'tick': self._on_tick}
+        for bit, event_type in enumerate(EVENT_CODES):
+            self._handlers[event_type] = self._event_handler(1 << bit)
+        for event_type, handler in self._handlers.items():
+            system.events.subscribe(event_type, handler)
+        return self
+
+    def detach(self):
+        """Stops listening to the system; buffered records are kept until flush or close."""
+        if self.system is not None:
+            for event_type, handler in self._handlers.items():
+                self.system.events.unsubscribe(event_type, handler)
+        self.system = None
+        self._handlers = {}
+
+    def _event_handler(self, bit):
+        def handler(**payload):
+            self.pending_events |= bit
+        return handler
+
+    def _on_tick(self, sim_time):
+        system = self.system
+        params = system.current_parameters
+        forces = 0
+        for name in system.forces:
+            forces |= 1 << FORCE_NAMES.index(name)
+        RECORD.pack_into(
+            self.buffer, self.buffered * RECORD.size,
+            self.tick, sim_time, params['entropy'], params['coupling'], params['consciousness'],
+            system.dimensions, len(system.particles), forces, self.pending_events,
+        )
+        self.tick += 1
+        self.pending_events = 0
+        self.buffered += 1
+        if self.buffered == self.buffer_ticks:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered records to the file."""
+        if self.buffered:
+            self.file.write(memoryview(self.buffer)[:self.buffered * RECORD.size])
+            self.buffered = 0
+        self.file.flush()
+
+    def close(self):
+        """Detaches, flushes and closes the file."""
+        self.detach()
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TrajectoryReader:
+    """
+    Memory-mapped, zero-copy access to a recorded trajectory.
+
+    `records` is a NumPy structured array over the file, so reader['entropy'],
+    reader['dimensions'] and the other columns are views with no copying. Any
+    tick can be looked up directly (seek), or the run replayed in order,
+    without re-simulating.
+    """
+    def __init__(self, path):
+        if np is None:
+            raise ImportError("TrajectoryReader requires NumPy to be installed.")
+        with open(path, 'rb') as f:
+            magic, record_size, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f"{path} is not a trajectory file in this format.")
+        # A partially written trailing record is ignored
+        count = (os.path.getsize(path) - HEADER.size) // record_size
+        self.path = path
+        self.records = (np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(count,))
+                        if count else np.empty(0, dtype=RECORD_DTYPE))
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, column):
+        """Returns a column (a field name such as 'entropy') as a zero-copy view."""
+        return self.records[column]
+
+    def seek(self, index):
+        """Returns the decoded state recorded at position index (negative counts from the end)."""
+        return self._decode(self.records[index])
+
+    def replay(self, start=0, stop=None):
+        """Yields the decoded state of every recorded tick in [start, stop)."""
+        for record in self.records[start:stop]:
+            yield self._decode(record)
+
+    def force_active(self, name):
+        """Boolean column: whether the named force was active at each tick."""
+        return (self.records['forces'] & (1 << FORCE_NAMES.index(name))) != 0
+
+    def event_ticks(self, event_type):
+        """Positions of the ticks at which the given event occurred."""
+        return np.flatnonzero(self.records['events'] & (1 << EVENT_CODES.index(event_type)))
+
+    @staticmethod
+    def _decode(record):
+        forces, events = int(record['forces']), int(record['events'])
+        return {
+            'tick': int(record['tick']),
+            'sim_time': float(record['sim_time']),
+            'parameters': {
+                'entropy': float(record['entropy']),
+                'coupling': float(record['coupling']),
+                'consciousness': float(record['consciousness']),
+            },
+            'dimensions': int(record['dimensions']),
+            'particles': int(record['particles']),
+            'forces': [name for bit, name in enumerate(FORCE_NAMES) if forces >> bit & 1],
+            'events': [name for bit, name in enumerate(EVENT_CODES) if events >> bit & 1],
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or replay a recorded entropic physics trajectory.")
+    parser.add_argument('path')
+    parser.add_argument('--seek', type=int, default=None, help="Print the state at this tick position")
+    parser.add_argument('--replay', action='store_true', help="Print every tick that had an event")
+    args = parser.parse_args()
+
+    reader = TrajectoryReader(args.path)
+    print(f"{args.path}: {len(reader):,d} ticks, {reader['sim_time'][-1] if len(reader) else 0:.1f}s simulated")
+    if args.seek is not None:
+        print(reader.seek(args.seek))
+    if args.replay:
+        for state in reader.replay():
+            if state['events']:
+                print(f"[{state['tick']:>8}] {state['dimensions']:>3}D {state['particles']:>4} particles "
+                      f"{', '.join(state['events'])}")
@@ -0,0 +1,304 @@
+import asyncio
+import ipaddress
+import itertools
+import json
+import os
+import time
+
+from entropic_physics_system import EntropicPhysicsSystem, snapshot_state
+
+# --- Protocol ---
+# Newline-delimited JSON in both directions. Every request is an object with
+# an 'op' and an optional 'id', which is echoed back in the reply:
+#   {"op": "create", "seed": 7, "tick_rate": 20}  -> {"ok": true, "session": 1, ...}
+#   {"op": "command", "session": 1, "command": "toggle"}
+#   {"op": "subscribe", "session": 1} / {"op": "unsubscribe", "session": 1}
+#   {"op": "state", "session": 1} / {"op": "list"} / {"op": "close", "session": 1}
+# Subscribed clients also receive {"event": "state", "session": ..., "state": ...}
+# whenever a session's snapshot changes, at most once per update_interval.
+DEFAULT_PORT = 8765
+MAX_LINE = 64 * 1024
+
+
+def require_loopback(host):
+    """Raises ValueError unless host resolves to a loopback address; the server never listens publicly."""
+    if host == 'localhost':
+        return
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        raise ValueError(f"Host must be a loopback address, got {host!r}.") from None
+    if not address.is_loopback:
+        raise ValueError(f"Host must be a loopback address, got {host!r}.")
+
+
+class Session:
+    """One hosted simulation and the clients subscribed to its state."""
+    def __init__(self, session_id, system):
+        self.id = session_id
+        self.system = system
+        self.subscribers = set()
+        self.sent_version = 0
+        self.sent_at = 0.0
+
+
+class Client:
+    """
+    One connection. Replies queue in order; state updates are coalesced per
+    session, so a slow reader gets the latest state instead of a backlog.
+    """
+    def __init__(self, writer):
+        self.writer = writer
+        self.outbox = asyncio.Queue()
+        self.latest_states = {}
+        self.subscriptions = set()
+
+    def reply(self, message):
+        self.outbox.put_nowait(message)
+
+    def push_state(self, session_id, message):
+        if session_id not in self.latest_states:
+            self.outbox.put_nowait(session_id)
+        self.latest_states[session_id] = message
+
+    async def send_loop(self):
+        while True:
+            item = await self.outbox.get()
+            if item is None:
+                return
+            if not isinstance(item, dict):
+                item = self.latest_states.pop(item, None)
+                if item is None:
+                    continue
+            self.writer.write(json.dumps(item).encode() + b"\n")
+            await self.writer.drain()
+
+
+class SimulationServer:
+    """
+    Hosts many independent EntropicPhysicsSystem sessions in one process.
+
+    Systems are created with threaded=False and stepped cooperatively from a
+    single asyncio task. Each round gives every running session at most
+    tick_budget ticks of its own fixed-timestep scheduler, yielding to the
+    event loop in between, so one busy session cannot starve the others; a
+    session that cannot keep up falls behind (its scheduler counts overruns)
+    instead. Commands run synchronously between rounds, exactly as run()
+    would run them.
+    """
+    def __init__(self, tick_budget=5, update_interval=0.1, max_sessions=256):
+        self.tick_budget = tick_budget
+        self.update_interval = update_interval
+        self.max_sessions = max_sessions
+        self.sessions = {}
+        self.clients = set()
+        self.session_ids = itertools.count(1)
+        self.wakeup = asyncio.Event()
+        self.server = None
+        self.stepper = None
+
+    # --- Sessions ---
+    def create_session(self, seed=None, tick_rate=2.0):
+        if len(self.sessions) >= self.max_sessions:
+            raise ValueError(f"Session limit of {self.max_sessions} reached.")
+        system = EntropicPhysicsSystem(seed=seed, tick_rate=tick_rate, threaded=False)
+        system.scheduler.max_substeps = self.tick_budget
+        session = Session(next(self.session_ids), system)
+        system.metrics_path = f'entropic_metrics_{session.id}.json'
+        self.sessions[session.id] = session
+        return session
+
+    def close_session(self, session_id):
+        session = self.sessions.pop(session_id)
+        for client in session.subscribers:
+            client.subscriptions.discard(session_id)
+            client.reply({'event': 'closed', 'session': session_id})
+        session.system.close()
+
+    def session(self, request):
+        try:
+            return self.sessions[request['session']]
+        except KeyError:
+            raise ValueError(f"Unknown session {request.get('session')!r}.") from None
+
+    # --- Stepping ---
+    async def step_sessions(self):
+        """Runs forever: advances every running session, then sleeps until the next tick is due."""
+        while True:
+            wait = None
+            for session in list(self.sessions.values()):
+                system = session.system
+                if system.is_running:
+                    due = system.scheduler.advance(system._scheduled_step)
+                    wait = due if wait is None else min(wait, due)
+                self.broadcast(session)
+                # Let commands and clients in between sessions
+                await asyncio.sleep(0)
+            self.wakeup.clear()
+            if wait is None:
+                wait = self.update_interval
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), max(0.0, wait))
+            except asyncio.TimeoutError:
+                pass
+
+    def broadcast(self, session, force=False):
+        """Pushes a session's state to its subscribers if it changed, rate-limited to update_interval."""
+        snapshot = session.system.snapshot
+        if not session.subscribers or snapshot.version == session.sent_version:
+            return
+        now = time.monotonic()
+        if not force and now - session.sent_at < self.update_interval:
+            return
+        session.sent_version = snapshot.version
+        session.sent_at = now
+        message = {'event': 'state', 'session': session.id, 'state': snapshot_state(snapshot)}
+        for client in session.subscribers:
+            client.push_state(session.id, message)
+
+    # --- Requests ---
+    def handle(self, client, request):
+        """Executes one request and returns the reply."""
+        op = request.get('op')
+        if op == 'create':
+            session = self.create_session(request.get('seed'), float(request.get('tick_rate', 2.0)))
+            if request.get('subscribe', True):
+                self.subscribe(client, session)
+            return {'session': session.id, 'state': snapshot_state(session.system.snapshot)}
+        if op == 'command':
+            session = self.session(request)
+            command = str(request.get('command', '')).lower().strip()
+            if not session.system.execute_command(command):
+                self.close_session(session.id)
+                return {'closed': True}
+            self.wakeup.set()
+            self.broadcast(session, force=True)
+            return {'state': snapshot_state(session.system.snapshot)}
+        if op == 'subscribe':
+            self.subscribe(client, self.session(request))
+            return {}
+        if op == 'unsubscribe':
+            session = self.session(request)
+            session.subscribers.discard(client)
+            client.subscriptions.discard(session.id)
+            return {}
+        if op == 'state':
+            return {'state': snapshot_state(self.session(request).system.snapshot)}
+        if op == 'list':
+            return {'sessions': [
+                {'session': session.id, 'is_running': session.system.is_running,
+                 'sim_time': session.system.sim_time, 'dimensions': session.system.dimensions,
+                 'scheduler': session.system.scheduler.metrics()}
+                for session in self.sessions.values()
+            ]}
+        if op == 'close':
+            self.close_session(self.session(request).id)
+            return {}
+        raise ValueError(f"Unknown op {op!r}.")
+
+    def subscribe(self, client, session):
+        session.subscribers.add(client)
+        client.subscriptions.add(session.id)
+        # A new subscriber gets the current state on the next round
+        session.sent_version = 0
+        self.wakeup.set()
+
+    async def serve_client(self, reader, writer):
+        client = Client(writer)
+        self.clients.add(client)
+        sender = asyncio.create_task(client.send_loop())
+        try:
+            while not sender.done():
+                line = await reader.readline()
+                if not line:
+                    break
+                request_id = None
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("Requests must be JSON objects.")
+                    request_id = request.get('id')
+                    reply = {'ok': True, **self.handle(client, request)}
+                except Exception as error:
+                    # A failing command (bad input, unwritable metrics file, ...) fails only its request
+                    reply = {'ok': False, 'error': str(error)}
+                if request_id is not None:
+                    reply['id'] = request_id
+                client.reply(reply)
+        except (ConnectionError, ValueError):
+            # Dropped connection, or a line longer than MAX_LINE
+            pass
+        finally:
+            # Sessions outlive their clients; they are only closed explicitly
+            for session_id in client.subscriptions:
+                if session_id in self.sessions:
+                    self.sessions[session_id].subscribers.discard(client)
+            self.clients.discard(client)
+            client.outbox.put_nowait(None)
+            try:
+                await sender
+            except ConnectionError:
+                pass
+            writer.close()
+
+    # --- Lifecycle ---
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT, unix_path=None):
+        """Starts listening on a loopback TCP port, or on a Unix socket when unix_path is given."""
+        if unix_path:
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)
+            self.server = await asyncio.start_unix_server(self.serve_client, unix_path, limit=MAX_LINE)
+            os.chmod(unix_path, 0o600)
+        else:
+            require_loopback(host)
+            self.server = await asyncio.start_server(self.serve_client, host, port, limit=MAX_LINE)
+        self.stepper = asyncio.create_task(self.step_sessions())
+        return self.server
+
+    async def close(self):
+        if self.stepper:
+            self.stepper.cancel()
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+        # Ending each connection lets its handler finish on its own
+        for client in list(self.clients):
+            client.writer.close()
+        while self.clients:
+            await asyncio.sleep(0.01)
+        for session_id in list(self.sessions):
+            self.close_session(session_id)
+
+
+async def serve(host='127.0.0.1', port=DEFAULT_PORT, unix_path=None, tick_budget=5, update_interval=0.1):
+    """Runs a SimulationServer until cancelled."""
+    simulation_server = SimulationServer(tick_budget, update_interval)
+    server = await simulation_server.start(host, port, unix_path)
+    addresses = ', '.join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Entropic simulation server listening on {addresses}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulation_server.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Host many entropic physics sessions over a local socket.")
+    parser.add_argument('--host', default='127.0.0.1', help="Loopback address to bind (non-loopback is refused)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', metavar='PATH', help="Listen on a Unix socket instead of TCP")
+    parser.add_argument('--tick-budget', type=int, default=5,
+                        help="Most ticks a session may run per scheduling round")
+    parser.add_argument('--update-interval', type=float, default=0.1,
+                        help="Minimum seconds between state updates per session")
+    args = parser.parse_args()
+
+    try:
+        require_loopback(args.host)
+        asyncio.run(serve(args.host, args.port, args.unix, args.tick_budget, args.update_interval))
+    except ValueError as error:
+        parser.error(str(error))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
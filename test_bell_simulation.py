@@ -0,0 +1,38 @@
+import unittest
+
+from bell_simulation import calculate_bell_parameter, correlation_sums, np
+
+
+class WorkerIndependenceTest(unittest.TestCase):
+    """A seed gives the same result for any number of workers."""
+
+    def assert_worker_independent(self, engine, num_trials, chunk_size):
+        serial = correlation_sums(num_trials, engine, chunk_size, seed=7, workers=1)
+        for workers in (2, 3):
+            with self.subTest(engine=engine, workers=workers):
+                self.assertEqual(correlation_sums(num_trials, engine, chunk_size, seed=7, workers=workers), serial)
+                self.assertEqual(calculate_bell_parameter(num_trials, engine, chunk_size, seed=7, workers=workers),
+                                 calculate_bell_parameter(num_trials, engine, chunk_size, seed=7, workers=1))
+
+    def test_python_engine(self):
+        # A partial last block checks that the trial count is cut exactly
+        self.assert_worker_independent('python', 5000, 700)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_engine(self):
+        self.assert_worker_independent('numpy', 50000, 4096)
+
+    def test_seed_changes_result(self):
+        self.assertNotEqual(correlation_sums(5000, 'python', 700, seed=7),
+                            correlation_sums(5000, 'python', 700, seed=8))
+
+
+class ValidationTest(unittest.TestCase):
+    def test_rejects_empty_runs(self):
+        for kwargs in ({'num_trials': 0}, {'num_trials': 1000, 'chunk_size': 0}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                correlation_sums(engine='python', seed=7, **kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()